@@ -0,0 +1,96 @@
+# about_page.py
+import streamlit as st
+
+
+def about_page():
+    
+
+    st.title("🌍 About Ecohealth Insights")
+    st.markdown("---")
+
+    # Introduction
+    st.markdown("""
+    Welcome to Ecohealth Insights a comprehensive environmental health platform designed to help you make informed decisions 
+    about your health based on environmental conditions. The platform combines real-time data with 
+    advanced analytics to provide personalized health recommendations.
+    """)
+
+    # Main Features Section using columns
+    st.header("🎯 Key Features")
+
+    # Weather & Health Monitoring
+    with st.expander("🌤️ Weather & Health Monitoring", expanded=False):
+        st.markdown("""
+        It provides real-time weather and air quality monitoring:
+        - **Location-based Data**: Enter your city, state, and country
+        - **Real-time Updates**: Powered by Tomorrow.io, Open-Meteo, and OpenWeatherMap APIs
+        - **Comprehensive Metrics**: Temperature, humidity, air quality index (AQI), and more
+        - **Instant Access**: Get immediate insights about your local environmental conditions
+        """)
+
+    # Personalized Health Recommendations
+    with st.expander("💡 Personalized Health Recommendations", expanded=False):
+        st.markdown("""
+        Receive AI-powered health advice tailored to your environment:
+        - **Smart Analysis**: Utilizes OpenAI's GPT-4 model
+        - **Context-Aware**: Recommendations based on:
+            - Current temperature
+            - Air quality levels
+            - Location-specific factors
+        - **Practical Advice**: Get actionable health and safety tips
+        - **Reliable Backup**: Rule-based recommendations when AI is unavailable
+        """)
+
+    # Data Visualization
+    with st.expander("📊 Data Visualization", expanded=False):
+        st.markdown("""
+        Interactive visualizations to understand environmental patterns:
+        - **Historical Weather Patterns**: Track temperature trends
+        - **AQI History**: Color-coded air quality visualizations
+        - **Weather Forecasts**: Interactive Plotly charts
+        - **Trend Analysis**: Rolling averages and pattern identification
+        """)
+
+    # Weekly Newsletter Service
+    with st.expander("📫 Weekly Newsletter Service", expanded=False):
+        st.markdown("""
+        Stay informed with comprehensive weekly updates:
+        - **Weather Summaries**: Coverage of major Indian and global cities
+        - **Health Advisories**: Personalized recommendations
+        - **Weekly Forecasts**: Upcoming weather predictions
+        - **Easy Subscription**: Simple email signup process
+        """)
+
+    # Environmental Health Education
+    with st.expander("📚 Environmental Health Education", expanded=False):
+        st.markdown("""
+        Learn about environmental impacts on health:
+        - **Educational Resources**: Understanding weather-health relationships
+        - **Activity Guidelines**: Recommendations for outdoor activities
+        - **Health Management**: Tips for different weather conditions
+        - **Environmental Awareness**: Impact of climate on well-being
+        """)
+
+    # Platform Features
+    st.header("💻 Platform Features")
+    st.markdown("""
+    - **Modern Interface**: Built with Streamlit for a responsive experience
+    - **Cross-Platform**: Works seamlessly on desktop and mobile devices
+    - **User-Friendly Navigation**: Easy access to all features
+    - **Interactive Components**: Engaging user interface elements
+    """)
+
+    # Call to Action
+    st.header("🚀 Get Started")
+    st.markdown("""
+        Ready to take control of your environmental health? Start by:
+        1. Checking your local weather conditions
+        2. Getting personalized health recommendations
+        3. Subscribing to our weekly newsletter
+        """)
+
+    # Footer
+    st.markdown("---")
+    st.markdown("""
+    💪 **Empowering you to make informed health decisions based on your environment**
+    """)
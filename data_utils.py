@@ -1,5 +1,70 @@
 import requests
 import os
+import json
+import threading
+from bisect import bisect_left
+from functools import lru_cache
+
+# One pooled session for Nominatim so repeat lookups reuse the TLS connection
+_SESSION = requests.Session()
+_SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8))
+_SESSION.headers.update({
+    "User-Agent": "WeatherHealthApp/1.0"  # Required by Nominatim
+})
+
+# Geocodes don't change, so found locations are also kept on disk and
+# survive restarts; the lru_cache below serves repeats within a process
+GEOCODE_CACHE_PATH = os.path.join("data", "geocode_cache.json")
+_geocode_store = None
+_geocode_store_lock = threading.Lock()
+
+def _stored_geocodes():
+    global _geocode_store
+    if _geocode_store is None:
+        try:
+            with open(GEOCODE_CACHE_PATH, encoding="utf-8") as f:
+                _geocode_store = json.load(f)
+        except (OSError, ValueError):
+            _geocode_store = {}
+    return _geocode_store
+
+def _store_geocode(query, result):
+    with _geocode_store_lock:
+        store = _stored_geocodes()
+        store[query] = list(result)
+        try:
+            os.makedirs(os.path.dirname(GEOCODE_CACHE_PATH), exist_ok=True)
+            tmp_path = GEOCODE_CACHE_PATH + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(store, f)
+            os.replace(tmp_path, GEOCODE_CACHE_PATH)
+        except OSError as e:
+            print(f"Could not save geocode cache: {str(e)}")
+
+@lru_cache(maxsize=2048)
+def _geocode(query):
+    """Look up a query on Nominatim; errors propagate so they aren't cached"""
+    with _geocode_store_lock:
+        stored = _stored_geocodes().get(query)
+    if stored:
+        return tuple(stored)
+
+    url = "https://nominatim.openstreetmap.org/search"
+    params = {
+        "q": query,
+        "format": "json",
+        "limit": 1
+    }
+
+    response = _SESSION.get(url, params=params, timeout=10)
+    response.raise_for_status()
+
+    data = response.json()
+    if data and len(data) > 0:
+        result = (float(data[0]["lat"]), float(data[0]["lon"]))
+        _store_geocode(query, result)
+        return result
+    return None
 
 def get_coordinates(city, state, country):
     """
@@ -25,25 +90,12 @@ def get_coordinates(city, state, country):
         
         query = ", ".join(query_parts)
         
-        # Call Nominatim API
-        url = "https://nominatim.openstreetmap.org/search"
-        params = {
-            "q": query,
-            "format": "json",
-            "limit": 1
-        }
-        headers = {
-            "User-Agent": "WeatherHealthApp/1.0"  # Required by Nominatim
-        }
-        
-        response = requests.get(url, params=params, headers=headers)
-        response.raise_for_status()
-        
-        data = response.json()
-        if data and len(data) > 0:
+        # Call Nominatim API (memoised per query string)
+        result = _geocode(query)
+        if result:
             return {
-                "lat": float(data[0]["lat"]),
-                "lng": float(data[0]["lon"])
+                "lat": result[0],
+                "lng": result[1]
             }
         else:
             return None
@@ -64,6 +116,30 @@ def celsius_to_fahrenheit(celsius):
     """
     return (celsius * 9/5) + 32
 
+# AQI category table: upper bound of each band (inclusive), with the
+# matching label and colour. Anything above the last bound is Hazardous.
+_AQI_BINS = (50, 100, 150, 200, 300)
+_AQI_LABELS = (
+    "Good",
+    "Moderate",
+    "Unhealthy for Sensitive Groups",
+    "Unhealthy",
+    "Very Unhealthy",
+    "Hazardous"
+)
+_AQI_COLORS = (
+    "#00e400",  # Green
+    "#ffff00",  # Yellow
+    "#ff7e00",  # Orange
+    "#ff0000",  # Red
+    "#99004c",  # Purple
+    "#7e0023"   # Maroon
+)
+
+def _aqi_band(aqi):
+    # bisect_left so a value equal to a bound stays in the lower band (<=)
+    return bisect_left(_AQI_BINS, aqi)
+
 def get_aqi_label(aqi):
     """
     Get descriptive label for AQI value.
@@ -74,18 +150,7 @@ def get_aqi_label(aqi):
     Returns:
         str: AQI category label
     """
-    if aqi <= 50:
-        return "Good"
-    elif aqi <= 100:
-        return "Moderate"
-    elif aqi <= 150:
-        return "Unhealthy for Sensitive Groups"
-    elif aqi <= 200:
-        return "Unhealthy"
-    elif aqi <= 300:
-        return "Very Unhealthy"
-    else:
-        return "Hazardous"
+    return _AQI_LABELS[_aqi_band(aqi)]
 
 def get_aqi_color(aqi):
     """
@@ -97,15 +162,4 @@ def get_aqi_color(aqi):
     Returns:
         str: Hex color code
     """
-    if aqi <= 50:
-        return "#00e400"  # Green
-    elif aqi <= 100:
-        return "#ffff00"  # Yellow
-    elif aqi <= 150:
-        return "#ff7e00"  # Orange
-    elif aqi <= 200:
-        return "#ff0000"  # Red
-    elif aqi <= 300:
-        return "#99004c"  # Purple
-    else:
-        return "#7e0023"  # Maroon
+    return _AQI_COLORS[_aqi_band(aqi)]
@@ -4,14 +4,15 @@ import sqlalchemy as sa
 from sqlalchemy import create_engine, Column, Integer, String, Boolean, DateTime, func
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from datetime import datetime
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from datetime import datetime, timedelta
+from contextlib import contextmanager
 
 # Create data directory if it doesn't exist
 data_dir = pathlib.Path("./data")
 data_dir.mkdir(exist_ok=True)
-os.chmod(data_dir, 0o777)  # Set directory permissions
 
-# Create SQLite database in the data directory with proper permissions
+# Create SQLite database in the data directory
 DATABASE_URL = "sqlite:///./data/newsletter_subscribers.db"
 
 # Configure SQLite engine with proper parameters
@@ -27,9 +28,20 @@ engine = create_engine(
     max_overflow=10,
     pool_timeout=30,
     pool_recycle=1800,
-    echo=True  # Log SQL queries for debugging
+    echo=os.environ.get("SQL_ECHO") == "1"  # Set SQL_ECHO=1 to log SQL queries for debugging
 )
 
+@sa.event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """WAL lets readers run alongside a writer; NORMAL sync skips an fsync per commit"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-20000")  # ~20 MB page cache
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+    cursor.close()
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
@@ -52,7 +64,6 @@ class Subscriber(Base):
         """Get the subscribed_at time in Indian Standard Time (IST)"""
         if self.subscribed_at:
             # Convert UTC to IST (UTC + 5:30)
-            from datetime import timedelta
             return self.subscribed_at + timedelta(hours=5, minutes=30)
         return None
         
@@ -60,195 +71,230 @@ class Subscriber(Base):
         """Get the last_email_sent time in Indian Standard Time (IST)"""
         if self.last_email_sent:
             # Convert UTC to IST (UTC + 5:30)
-            from datetime import timedelta
             return self.last_email_sent + timedelta(hours=5, minutes=30)
         return None
 
-# Create tables
-try:
-    # Create database file
-    if not os.path.exists("./data/newsletter_subscribers.db"):
-        open("./data/newsletter_subscribers.db", "w").close()
-        os.chmod("./data/newsletter_subscribers.db", 0o666)
-        print("Created empty database file with write permissions")
-    
-    # Create tables
-    Base.metadata.create_all(bind=engine)
-    print("Database tables created successfully")
-except Exception as e:
-    print(f"Error creating database tables: {str(e)}")
-    # Try creating tables with a fresh connection if there was an error
+# Partial index over active rows only: small, and it serves the
+# is_active == True filters without scanning unsubscribed rows
+active_subscribers_index = sa.Index(
+    "ix_subscribers_active",
+    Subscriber.email,
+    sqlite_where=(Subscriber.is_active == True)
+)
+
+# Create tables. SQLite creates the database file itself on first connect,
+# and create_all only adds tables that are missing, so this never touches
+# existing data.
+_initialized = False
+
+def init_db():
+    """Create any missing tables, once per process"""
+    global _initialized
+    if _initialized:
+        return
     try:
-        # Recreate database file if needed
-        if os.path.exists("./data/newsletter_subscribers.db"):
-            os.remove("./data/newsletter_subscribers.db")
-        open("./data/newsletter_subscribers.db", "w").close()
-        os.chmod("./data/newsletter_subscribers.db", 0o666)
-        print("Recreated empty database file with write permissions")
-        
-        # Create tables with a fresh connection
-        connection = engine.connect()
-        Base.metadata.create_all(bind=connection)
-        connection.close()
-        print("Database tables created successfully with fresh connection")
+        Base.metadata.create_all(bind=engine)
+        # create_all skips indexes on tables that already exist
+        active_subscribers_index.create(bind=engine, checkfirst=True)
+        _initialized = True
     except Exception as e:
         print(f"Fatal error creating database tables: {str(e)}")
         raise
 
-def get_db():
-    """Get a database session with automatic retry on failure"""
-    from sqlalchemy import text
-    
-    max_attempts = 3
-    attempt = 0
-    last_error = None
-    db = None
-    
-    while attempt < max_attempts:
-        try:
-            db = SessionLocal()
-            # Test the connection with proper SQLAlchemy text() function
-            db.execute(text("SELECT 1"))
-            return db
-        except Exception as e:
-            last_error = e
-            attempt += 1
-            print(f"Database connection attempt {attempt} failed: {str(e)}")
-            
-            # Close the session if it was created
-            if db is not None:
-                try:
-                    db.close()
-                    db = None
-                except:
-                    pass
-                
-            # Wait before retrying
-            if attempt < max_attempts:
-                import time
-                time.sleep(1)
-    
-    # If we get here, all attempts failed
-    raise Exception(f"Failed to connect to database after {max_attempts} attempts: {str(last_error)}")
+init_db()
 
-def add_subscriber(name, email, city=None, state=None, country=None):
-    """Add a new subscriber to the database"""
-    db = get_db()
+@contextmanager
+def session_scope():
+    """Yield a session for one unit of work and always close it.
+
+    No probe query is issued up front: the pool already recycles stale
+    connections, and a failing statement surfaces through the caller's
+    own error handling.
+    """
+    db = SessionLocal()
     try:
-        # Check if email already exists
-        existing = db.query(Subscriber).filter(Subscriber.email == email).first()
-        if existing:
-            if not existing.is_active:
-                # Reactivate if previously unsubscribed
-                existing.is_active = True
-                existing.name = name
-                existing.location_city = city
-                existing.location_state = state
-                existing.location_country = country
-                db.commit()
-                return {"success": True, "message": "Subscription reactivated successfully!"}
-            return {"success": False, "message": "Email already subscribed"}
-        
-        # Create new subscriber
-        subscriber = Subscriber(
-            name=name,
-            email=email,
-            location_city=city,
-            location_state=state,
-            location_country=country
-        )
-        db.add(subscriber)
-        db.commit()
-        return {"success": True, "message": "Subscribed successfully!"}
-    except Exception as e:
-        db.rollback()
-        return {"success": False, "message": f"Error adding subscriber: {str(e)}"}
+        yield db
     finally:
         db.close()
 
+def add_subscriber(name, email, city=None, state=None, country=None):
+    """Add a new subscriber to the database.
+
+    A single upsert inserts new emails and reactivates unsubscribed ones;
+    emails that are already active are left untouched.
+
+    On success the result also carries the saved (detached) Subscriber, so
+    callers don't need a second lookup by email.
+    """
+    now = datetime.utcnow()
+    stmt = sqlite_insert(Subscriber).values(
+        name=name,
+        email=email,
+        subscribed_at=now,
+        is_active=True,
+        location_city=city,
+        location_state=state,
+        location_country=country
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Subscriber.email],
+        set_={
+            "is_active": True,
+            "name": stmt.excluded.name,
+            "location_city": stmt.excluded.location_city,
+            "location_state": stmt.excluded.location_state,
+            "location_country": stmt.excluded.location_country
+        },
+        # Reactivate if previously unsubscribed; active rows are not touched
+        where=(Subscriber.is_active == False)
+    ).returning(Subscriber)
+
+    with session_scope() as db:
+        try:
+            subscriber = db.scalars(stmt).first()
+            if subscriber is not None:
+                # Detach before commit so the returned row isn't expired
+                db.expunge(subscriber)
+            db.commit()
+            if subscriber is None:
+                return {"success": False, "message": "Email already subscribed"}
+
+            # Only a fresh insert carries this call's timestamp
+            if subscriber.subscribed_at == now:
+                return {"success": True, "message": "Subscribed successfully!", "subscriber": subscriber}
+            return {"success": True, "message": "Subscription reactivated successfully!", "subscriber": subscriber}
+        except Exception as e:
+            db.rollback()
+            return {"success": False, "message": f"Error adding subscriber: {str(e)}"}
+
 def get_active_subscribers():
     """Get all active subscribers"""
-    db = get_db()
-    try:
-        subscribers = db.query(Subscriber).filter(Subscriber.is_active == True).all()
-        return subscribers
-    finally:
-        db.close()
+    with session_scope() as db:
+        return db.query(Subscriber).filter(Subscriber.is_active == True).all()
+
+def iter_active_subscribers(batch_size=500):
+    """Stream active subscribers as lightweight rows.
+
+    Only the columns the newsletter needs are selected, and rows are fetched
+    batch_size at a time, so large mailing lists are never loaded into
+    memory all at once. Rows support attribute access (row.email, row.name,
+    ...) and arrive ordered by location, so subscribers who share a location
+    are consecutive.
+    """
+    stmt = (
+        sa.select(
+            Subscriber.email,
+            Subscriber.name,
+            Subscriber.location_city,
+            Subscriber.location_state,
+            Subscriber.location_country
+        )
+        .where(Subscriber.is_active == True)
+        .order_by(
+            Subscriber.location_country,
+            Subscriber.location_state,
+            Subscriber.location_city,
+            Subscriber.email
+        )
+        .execution_options(yield_per=batch_size)
+    )
+    with session_scope() as db:
+        yield from db.execute(stmt)
 
 def unsubscribe(email):
     """Unsubscribe a user by email"""
-    db = get_db()
-    try:
-        subscriber = db.query(Subscriber).filter(Subscriber.email == email).first()
-        if subscriber:
-            subscriber.is_active = False
+    with session_scope() as db:
+        try:
+            subscriber = db.query(Subscriber).filter(Subscriber.email == email).first()
+            if subscriber:
+                subscriber.is_active = False
+                db.commit()
+                return {"success": True, "message": "Unsubscribed successfully"}
+            return {"success": False, "message": "Email not found"}
+        except Exception as e:
+            db.rollback()
+            return {"success": False, "message": f"Error unsubscribing: {str(e)}"}
+
+# SQLite caps bound parameters per statement (999 on older builds)
+_BULK_CHUNK_SIZE = 500
+
+def update_last_email_sent_bulk(emails):
+    """Stamp last_email_sent for many subscribers in one transaction.
+
+    Args:
+        emails (list): Email addresses that were just sent a newsletter
+
+    Returns:
+        int: Number of subscriber rows updated
+    """
+    emails = list(emails)
+    if not emails:
+        return 0
+
+    now = datetime.utcnow()
+    with session_scope() as db:
+        try:
+            updated = 0
+            for start in range(0, len(emails), _BULK_CHUNK_SIZE):
+                result = db.execute(
+                    sa.update(Subscriber)
+                    .where(Subscriber.email.in_(emails[start:start + _BULK_CHUNK_SIZE]))
+                    .values(last_email_sent=now)
+                )
+                updated += result.rowcount
             db.commit()
-            return {"success": True, "message": "Unsubscribed successfully"}
-        return {"success": False, "message": "Email not found"}
-    except Exception as e:
-        db.rollback()
-        return {"success": False, "message": f"Error unsubscribing: {str(e)}"}
-    finally:
-        db.close()
+            return updated
+        except Exception as e:
+            db.rollback()
+            print(f"Error updating last email sent: {str(e)}")
+            return 0
 
 def update_last_email_sent(email):
     """Update the last_email_sent timestamp for a subscriber"""
-    db = get_db()
-    try:
-        subscriber = db.query(Subscriber).filter(Subscriber.email == email).first()
-        if subscriber:
-            subscriber.last_email_sent = datetime.utcnow()
-            db.commit()
-            return True
-        return False
-    except Exception as e:
-        db.rollback()
-        return False
-    finally:
-        db.close()
+    return update_last_email_sent_bulk([email]) > 0
         
 def delete_subscriber(email):
     """Permanently delete a subscriber by email"""
-    db = get_db()
-    try:
-        subscriber = db.query(Subscriber).filter(Subscriber.email == email).first()
-        if subscriber:
-            db.delete(subscriber)
-            db.commit()
-            return {"success": True, "message": f"Subscriber {email} has been permanently deleted"}
-        return {"success": False, "message": f"No subscriber found with email: {email}"}
-    except Exception as e:
-        db.rollback()
-        return {"success": False, "message": f"Error deleting subscriber: {str(e)}"}
-    finally:
-        db.close()
+    with session_scope() as db:
+        try:
+            subscriber = db.query(Subscriber).filter(Subscriber.email == email).first()
+            if subscriber:
+                db.delete(subscriber)
+                db.commit()
+                return {"success": True, "message": f"Subscriber {email} has been permanently deleted"}
+            return {"success": False, "message": f"No subscriber found with email: {email}"}
+        except Exception as e:
+            db.rollback()
+            return {"success": False, "message": f"Error deleting subscriber: {str(e)}"}
         
 def count_subscribers():
     """Count active and inactive subscribers"""
-    db = get_db()
-    try:
-        active_count = db.query(Subscriber).filter(Subscriber.is_active == True).count()
-        inactive_count = db.query(Subscriber).filter(Subscriber.is_active == False).count()
-        return {
-            "success": True, 
-            "total": active_count + inactive_count,
-            "active": active_count,
-            "inactive": inactive_count
-        }
-    except Exception as e:
-        return {"success": False, "message": f"Error counting subscribers: {str(e)}"}
-    finally:
-        db.close()
+    with session_scope() as db:
+        try:
+            # One grouped scan instead of a COUNT per status
+            counts = dict(
+                db.query(Subscriber.is_active, func.count(Subscriber.id))
+                .group_by(Subscriber.is_active)
+                .all()
+            )
+            active_count = counts.get(True, 0)
+            inactive_count = counts.get(False, 0)
+            return {
+                "success": True, 
+                "total": active_count + inactive_count,
+                "active": active_count,
+                "inactive": inactive_count
+            }
+        except Exception as e:
+            return {"success": False, "message": f"Error counting subscribers: {str(e)}"}
         
 def clear_all_subscribers():
     """Delete all subscribers from the database"""
-    db = get_db()
-    try:
-        db.query(Subscriber).delete()
-        db.commit()
-        return {"success": True, "message": "All subscriber data has been deleted"}
-    except Exception as e:
-        db.rollback()
-        return {"success": False, "message": f"Error deleting data: {str(e)}"}
-    finally:
-        db.close()
+    with session_scope() as db:
+        try:
+            db.query(Subscriber).delete()
+            db.commit()
+            return {"success": True, "message": "All subscriber data has been deleted"}
+        except Exception as e:
+            db.rollback()
+            return {"success": False, "message": f"Error deleting data: {str(e)}"}
@@ -0,0 +1,158 @@
+# home_page.py
+import os
+import re
+import base64
+from functools import lru_cache
+from datetime import datetime
+import streamlit as st
+
+
+# Card illustrations live in ./assets. They're read, minified and base64
+# encoded once when this module is first imported, not on every rerun.
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+
+def _minify_svg(svg_content):
+    svg_content = re.sub(r'<!--.*?-->', '', svg_content, flags=re.S)
+    return re.sub(r'>\s+<', '><', svg_content).strip()
+
+def _load_svg(filename):
+    with open(os.path.join(ASSETS_DIR, filename), encoding='utf-8') as f:
+        return _minify_svg(f.read())
+
+weather_svg = _load_svg("weather.svg")
+aqi_svg = _load_svg("aqi.svg")
+health_svg = _load_svg("health.svg")
+
+def _svg_img_html(svg_content):
+    b64 = base64.b64encode(svg_content.encode('utf-8')).decode('utf-8')
+    return f'<img src="data:image/svg+xml;base64,{b64}" style="max-width: 100%; height: auto;">'
+
+WEATHER_IMG_HTML = _svg_img_html(weather_svg)
+AQI_IMG_HTML = _svg_img_html(aqi_svg)
+HEALTH_IMG_HTML = _svg_img_html(health_svg)
+
+# Card styling for the home page
+_HOME_CSS = """
+<style>
+.card {
+    border-radius: 10px;
+    padding: 20px;
+    margin-bottom: 20px;
+    background-color: white;
+    box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+    transition: transform 0.3s ease;
+}
+.card:hover {
+    transform: translateY(-5px);
+    box-shadow: 0 10px 20px rgba(0, 0, 0, 0.1);
+}
+.card-header {
+    font-size: 1.5rem;
+    font-weight: bold;
+    margin-bottom: 15px;
+    color: #1e3a8a;
+}
+.card-description {
+    font-size: 1.0rem;
+    color: #4b5563;
+    margin-bottom: 15px;
+}
+</style>
+"""
+
+# Card markup only depends on its text, so each card is assembled once per
+# process rather than re-formatted around the image data on every rerun
+@lru_cache(maxsize=32)
+def _card_html(header, description, img_html, caption=""):
+    html = f"""
+    <div class="card">
+        <div class="card-header">{header}</div>
+        <div class="card-description">{description}</div>
+        {img_html}
+    """
+    if caption:
+        html += f"<div style='text-align: center; padding: 10px;'>{caption}</div>"
+    return html + "</div>"
+
+# The footer timestamp ticks on its own, so only this fragment reruns each
+# minute instead of the whole home page
+@st.fragment(run_every=60)
+def _home_footer():
+    st.markdown(
+        "<div style='margin-top: 30px; text-align: center; color: #6b7280;'>"
+        f"© 2025 EcoHealth Insights | Data updated: {datetime.now():%Y-%m-%d %H:%M}</div>",
+        unsafe_allow_html=True
+    )
+
+def home_page():
+    # Card styling
+    st.markdown(_HOME_CSS, unsafe_allow_html=True)
+
+    # Header Section
+    st.markdown("<h1 style='text-align: center; color: #166534;'>Welcome to Ecohealth Insights</h1>", unsafe_allow_html=True)
+    st.markdown("<h3 style='text-align: center; color: #4b5563; margin-bottom: 50px;'>Get personalized health recommendations based on your local environmental conditions</h3>", unsafe_allow_html=True)
+
+    # Static location (replace with dynamic input if needed)
+    location = "Your Location"
+
+    # Main Features Section - Cards
+    col1, col2, col3 = st.columns(3)
+
+    # One markdown call per card, with the card div closed in the same block
+    with col1:
+        st.markdown(_card_html(
+            "Real-time Weather",
+            "Get accurate temperature and weather conditions for your location",
+            WEATHER_IMG_HTML,
+            f"Current conditions for <b>{location}</b>" if location else ""
+        ), unsafe_allow_html=True)
+
+    with col2:
+        st.markdown(_card_html(
+            "Air Quality Index",
+            "Monitor real-time air quality data and pollution levels",
+            AQI_IMG_HTML,
+            f"Air quality data for <b>{location}</b>" if location else ""
+        ), unsafe_allow_html=True)
+
+    with col3:
+        st.markdown(_card_html(
+            "Health Recommendations",
+            "Get AI-powered health insights based on environmental conditions",
+            HEALTH_IMG_HTML,
+            f"Health recommendations for <b>{location}</b>" if location else ""
+        ), unsafe_allow_html=True)
+
+    # Additional Information Section
+    st.markdown("<div style='margin-top: 30px;'></div>", unsafe_allow_html=True)
+    info_col1, info_col2 = st.columns(2)
+
+    with info_col1:
+        st.markdown("""
+        <div class="card">
+            <div class="card-header">How It Works</div>
+            <p>EcoHealth Insights combines real-time environmental data with advanced algorithms to provide you with personalized health recommendations.</p>
+            <p>Our system analyzes:</p>
+            <ul>
+                <li>Current weather conditions</li>
+                <li>Local air quality measurements</li>
+                <li>Seasonal health trends</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with info_col2:
+        st.markdown("""
+        <div class="card">
+            <div class="card-header">Why EcoHealth Insights?</div>
+            <ul>
+                <li><b>Personalized</b>: Recommendations tailored to your specific location</li>
+                <li><b>Real-time</b>: Always up-to-date with the latest environmental data</li>
+                <li><b>Science-backed</b>: Insights based on verified health research</li>
+                <li><b>User-friendly</b>: Clear, actionable recommendations</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Footer
+    _home_footer()
@@ -6,10 +6,12 @@ import numpy as np
 import requests
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import LabelEncoder
-from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
+from sklearn.ensemble import HistGradientBoostingClassifier, RandomForestRegressor
 from sklearn.metrics import mean_squared_error
 from datetime import datetime, timedelta
+from functools import lru_cache
 import pytz
+import joblib
 from dotenv import load_dotenv
 
 
@@ -18,10 +20,19 @@ load_dotenv()
 OPENWEATHER_API_KEY = os.environ.get("OPENWEATHERMAP_API_KEY", "")
 BASE_URL = 'https://api.openweathermap.org/data/2.5/'
 
-# Get Current Weather from API
+# Shared session so repeated lookups reuse the pooled keep-alive connection
+_SESSION = requests.Session()
+_SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+# Get Current Weather from API. Responses are cached for 10 minutes per city
+# so repeated clicks don't go back to OpenWeather.
 def get_current_weather(city):
+    return _fetch_current_weather(city.strip().lower())
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _fetch_current_weather(city):
     url = f"{BASE_URL}weather?q={city}&appid={OPENWEATHER_API_KEY}&units=metric"
-    response = requests.get(url)
+    response = _SESSION.get(url, timeout=5)
     data = response.json()
     coords = data.get('coord', {})
     return {
@@ -40,46 +51,146 @@ def get_current_weather(city):
         'Wind_Gust_Speed': data['wind']['speed']
     }
 
-# Load and clean historical dataset
+# Load and clean historical dataset. The parse is cached per file version
+# (keyed on mtime); callers get a copy since prepare_data edits it in place.
+@lru_cache(maxsize=4)
+def _read_historical_data(filename, mtime):
+    return pd.read_csv(filename).dropna().drop_duplicates()
+
 def read_historical_data(filename):
-    df = pd.read_csv(filename).dropna().drop_duplicates()
-    return df
+    return _read_historical_data(filename, os.path.getmtime(filename)).copy()
 
 # Encode categorical variables and prepare features/target
+# (one encoder per column, so the wind encoder still knows the compass points)
 def prepare_data(data):
-    le = LabelEncoder()
-    data['WindGustDir'] = le.fit_transform(data['WindGustDir'])
-    data['RainTomorrow'] = le.fit_transform(data['RainTomorrow'])
+    wind_le = LabelEncoder()
+    rain_le = LabelEncoder()
+    data['WindGustDir'] = wind_le.fit_transform(data['WindGustDir'])
+    data['RainTomorrow'] = rain_le.fit_transform(data['RainTomorrow'])
     X = data[['MinTemp', 'MaxTemp', 'WindGustDir', 'WindGustSpeed', 'Humidity', 'Pressure', 'Temp']]
     y = data['RainTomorrow']
-    return X, y, le
+    return X, y, wind_le, rain_le
 
 def train_rain_model(X, y):
     X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
-    model = RandomForestClassifier(n_estimators=100, random_state=42)
+    model = HistGradientBoostingClassifier(max_iter=100, random_state=42)
     model.fit(X_train, y_train)
     y_pred = model.predict(X_test)
     mse = mean_squared_error(y_test, y_pred)
     return model, mse
 
+# Each value is used to predict the next one
 def prepare_regression_data(data, feature):
-    X, y = [], []
-    for i in range(len(data) - 1):
-        X.append(data[feature].iloc[i])
-        y.append(data[feature].iloc[i + 1])
-    return np.array(X).reshape(-1, 1), np.array(y)
+    values = data[feature].to_numpy()
+    return values[:-1].reshape(-1, 1), values[1:]
 
 def train_regression_model(X, y):
-    model = RandomForestRegressor(n_estimators=100, random_state=42)
+    # Trees are independent, so build them on every core
+    model = RandomForestRegressor(n_estimators=100, random_state=42, n_jobs=-1)
     model.fit(X, y)
     return model
 
-def predict_future(model, current_value):
-    predictions = [current_value]
+# Compass sectors: a wind direction in [COMPASS_EDGES[i], COMPASS_EDGES[i+1])
+# maps to COMPASS_POINTS[i]
+COMPASS_EDGES = np.array([
+    0, 11.25, 33.75, 56.25, 78.75, 101.25, 123.75, 146.25, 168.75,
+    191.25, 213.75, 236.25, 258.75, 281.25, 303.75, 326.25, 348.75
+])
+COMPASS_POINTS = np.array([
+    "N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE", "S",
+    "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW", "N"
+])
+
+# Encoded value of each compass sector, -1 where the encoder never saw it
+def compass_codes(le):
+    known = np.isin(COMPASS_POINTS, le.classes_)
+    codes = np.full(len(COMPASS_POINTS), -1)
+    codes[known] = le.transform(COMPASS_POINTS[known])
+    return codes
+
+# Trained models are saved here and reused until weather.csv changes
+MODEL_DIR = os.path.join("data", "models")
+MODEL_PATH = os.path.join(MODEL_DIR, "weather_models.pkl")
+# Bump whenever train_models changes; older saved files are retrained
+MODEL_VERSION = 2
+
+def train_models(filename):
+    historical_data = read_historical_data(filename)
+    X, y, wind_le, rain_le = prepare_data(historical_data)
+    rain_model, mse = train_rain_model(X, y)
+    return {
+        'version': MODEL_VERSION,
+        'rain_model': rain_model,
+        'mse': mse,
+        'wind_le': wind_le,
+        'rain_le': rain_le,
+        'temp_model': train_regression_model(*prepare_regression_data(historical_data, 'Temp')),
+        'hum_model': train_regression_model(*prepare_regression_data(historical_data, 'Humidity')),
+    }
+
+# Load the persisted models, retraining only when the CSV is newer than them
+def load_or_train_models(filename="weather.csv"):
+    models = None
+    try:
+        if os.path.getmtime(MODEL_PATH) >= os.path.getmtime(filename):
+            models = joblib.load(MODEL_PATH)
+            if models.get('version') != MODEL_VERSION:
+                models = None
+    except Exception as e:
+        if os.path.exists(MODEL_PATH):
+            print(f"Could not load saved models, retraining: {e}")
+
+    if models is None:
+        models = train_models(filename)
+        try:
+            os.makedirs(MODEL_DIR, exist_ok=True)
+            joblib.dump(models, MODEL_PATH, compress=3)
+        except Exception as e:
+            print(f"Could not save trained models: {e}")
+
+    models['compass_codes'] = compass_codes(models['wind_le'])
+    models['temp_steps'] = forest_step_table(models['temp_model'])
+    models['hum_steps'] = forest_step_table(models['hum_model'])
+    return models
+
+# Models shared across reruns and sessions; the CSV's mtime is part of the
+# key so editing weather.csv picks up a retrained set
+@st.cache_resource(show_spinner=False)
+def _cached_models(filename, csv_mtime):
+    return load_or_train_models(filename)
+
+def get_models(filename="weather.csv"):
+    return _cached_models(filename, os.path.getmtime(filename))
+
+# A forest fitted on one feature is a step function of that feature: it only
+# changes value at the trees' split thresholds. Tabulate it once so each
+# forecast step is a binary search instead of a full forest predict.
+def forest_step_table(model):
+    thresholds = np.unique(np.concatenate([
+        est.tree_.threshold[est.tree_.children_left != -1] for est in model.estimators_
+    ]))
+    if len(thresholds) == 0:
+        return thresholds, model.predict(np.zeros((1, 1)))
+
+    # Trees compare float32 inputs, so evaluate each interval at the largest
+    # float32 inside it, plus one point past the last threshold
+    points = thresholds.astype(np.float32)
+    above = points > thresholds
+    points[above] = np.nextafter(points[above], np.float32(-np.inf))
+    last = np.float32(thresholds[-1])
+    if last <= thresholds[-1]:
+        last = np.nextafter(last, np.float32(np.inf))
+    points = np.append(points, last)
+    return thresholds, model.predict(points.reshape(-1, 1))
+
+def predict_future(step_table, current_value):
+    thresholds, values = step_table
+    predictions = []
+    value = current_value
     for _ in range(5):
-        next_value = model.predict(np.array([[predictions[-1]]]))
-        predictions.append(next_value[0])
-    return predictions[1:]
+        value = values[np.searchsorted(thresholds, np.float32(value), side='left')]
+        predictions.append(value)
+    return predictions
 
 # Streamlit Page Function
 def model_page():
@@ -97,21 +208,12 @@ def model_page():
                 st.subheader(f"📍 Location: {current_weather['city']}, {current_weather['country']}")
                 st.map(pd.DataFrame({'lat': [lat], 'lon': [lon]}))
 
-                historical_data = read_historical_data("weather.csv")
-                X, y, le = prepare_data(historical_data)
-                rain_model, mse = train_rain_model(X, y)
+                models = get_models("weather.csv")
+                rain_model, mse = models['rain_model'], models['mse']
 
                 wind_deg = current_weather['wind_gust_dir'] % 360
-                compass_points = [
-                    ("N", 0, 11.25), ("NNE", 11.25, 33.75), ("NE", 33.75, 56.25),
-                    ("ENE", 56.25, 78.75), ("E", 78.75, 101.25), ("ESE", 101.25, 123.75),
-                    ("SE", 123.75, 146.25), ("SSE", 146.25, 168.75), ("S", 168.75, 191.25),
-                    ("SSW", 191.25, 213.75), ("SW", 213.75, 236.25), ("WSW", 236.25, 258.75),
-                    ("W", 258.75, 281.25), ("WNW", 281.25, 303.75), ("NW", 303.75, 326.25),
-                    ("NNW", 326.25, 348.75), ("N", 348.75, 360)
-                ]
-                compass_direction = next(point for point, start, end in compass_points if start <= wind_deg < end)
-                compass_direction_encoded = le.transform([compass_direction])[0] if compass_direction in le.classes_ else -1
+                compass_index = np.searchsorted(COMPASS_EDGES, wind_deg, side='right') - 1
+                compass_direction_encoded = int(models['compass_codes'][compass_index])
 
                 current_data = {
                     'MinTemp': current_weather['temp_min'],
@@ -125,11 +227,8 @@ def model_page():
                 current_df = pd.DataFrame([current_data])
                 rain_prediction = rain_model.predict(current_df)[0]
 
-                temp_model = train_regression_model(*prepare_regression_data(historical_data, 'Temp'))
-                hum_model = train_regression_model(*prepare_regression_data(historical_data, 'Humidity'))
-
-                future_temp = predict_future(temp_model, current_weather['temp_min'])
-                future_humidity = predict_future(hum_model, current_weather['humidity'])
+                future_temp = predict_future(models['temp_steps'], current_weather['temp_min'])
+                future_humidity = predict_future(models['hum_steps'], current_weather['humidity'])
 
                 timezone = pytz.timezone('Asia/Kolkata')
                 now = datetime.now(timezone).replace(minute=0, second=0, microsecond=0)
@@ -162,7 +261,7 @@ def model_page():
                 })
 
                 with st.expander("🔍 Forecast Data Table"):
-                    st.dataframe(forecast_df)
+                    st.dataframe(forecast_df, hide_index=True)
 
                 st.line_chart(forecast_df.set_index("Time"))
 
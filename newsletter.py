@@ -1,9 +1,19 @@
 import os
+import time
+import threading
+import itertools
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import SimpleNamespace
+from collections import OrderedDict
 import sendgrid
-from sendgrid.helpers.mail import Mail, Email, To, Content, MimeType
+from sendgrid.helpers.mail import Mail, Email, To, Content, MimeType, Personalization, Substitution
 from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.executors.pool import ThreadPoolExecutor as APThreadPoolExecutor
+from jinja2 import Environment, FileSystemLoader
 from dotenv import load_dotenv
 import weather_api as weather
 import data_utils as utils
@@ -40,6 +50,69 @@ GLOBAL_CITIES = [
     {"city": "Toronto", "state": "Ontario", "country": "Canada"}
 ]
 
+# One SendGrid client for the process instead of one per email
+@lru_cache(maxsize=1)
+def _sendgrid_client():
+    return sendgrid.SendGridAPIClient(api_key=SENDGRID_API_KEY)
+
+# Cap on concurrent weather API requests
+MAX_FETCH_WORKERS = 10
+# Cap on concurrent SendGrid requests; keep well under the account's rate limit
+MAX_SEND_WORKERS = 20
+
+# Weather responses are reused by every email built within these windows,
+# so a newsletter run fetches each location once rather than per subscriber
+CURRENT_CACHE_TTL = 600
+FORECAST_CACHE_TTL = 1800
+# Subscriber locations are cached too, so bound the cache for the
+# long-lived scheduler process; expired entries are dropped on insert
+WEATHER_CACHE_MAX_ENTRIES = 1024
+_weather_cache = OrderedDict()
+_weather_cache_lock = threading.Lock()
+
+def _cached_weather(kind, fetch, lat, lng, ttl):
+    key = (kind, round(lat, 3), round(lng, 3))
+    with _weather_cache_lock:
+        hit = _weather_cache.get(key)
+        if hit is not None and time.monotonic() < hit[0]:
+            return hit[1]
+
+    value = fetch(lat, lng)
+    # Don't keep a failed lookup or placeholder data around for the whole TTL
+    if isinstance(value, weather.FallbackData) or (isinstance(value, dict) and value.get("error")):
+        return value
+
+    with _weather_cache_lock:
+        now = time.monotonic()
+        for expired in [k for k, (expires, _) in _weather_cache.items() if expires <= now]:
+            del _weather_cache[expired]
+        _weather_cache[key] = (now + ttl, value)
+        _weather_cache.move_to_end(key)
+        while len(_weather_cache) > WEATHER_CACHE_MAX_ENTRIES:
+            _weather_cache.popitem(last=False)
+    return value
+
+def get_current_weather_cached(lat, lng):
+    return _cached_weather("current", weather.get_current_weather_and_aqi, lat, lng, CURRENT_CACHE_TTL)
+
+def get_forecast_cached(lat, lng):
+    return _cached_weather("forecast", weather.get_forecast_data, lat, lng, FORECAST_CACHE_TTL)
+
+def _fetch_city_weather(lat, lng):
+    """Fetch current conditions and the 7-day forecast for one location"""
+    return {
+        "current": get_current_weather_cached(lat, lng),
+        "forecast": get_forecast_cached(lat, lng)
+    }
+
+# Subsets of the lists above shown in the welcome email's weather report
+REPORT_INDIA_CITIES = {"Mumbai", "Delhi", "Bangalore", "Chennai", "Kolkata"}
+REPORT_GLOBAL_CITIES = {"New York", "London", "Tokyo", "Sydney", "Paris"}
+
+def city_key(city_info):
+    """Display name and result key for a city, e.g. "London, United Kingdom" """
+    return f"{city_info['city']}, {city_info['state']}, {city_info['country']}".replace(", ,", ",")
+
 def get_weather_forecast_for_cities(cities_list):
     """
     Get weather forecast data for a list of cities
@@ -50,47 +123,110 @@ def get_weather_forecast_for_cities(cities_list):
     Returns:
         dict: Dictionary with city names as keys and weather data as values
     """
-    result = {}
-    
+    # Geocode one at a time (Nominatim allows one request at a time and the
+    # results are cached), then fetch the weather for all cities concurrently
+    located = []
     for city_info in cities_list:
         try:
-            # Get coordinates
             coordinates = utils.get_coordinates(
                 city_info["city"], 
                 city_info["state"], 
                 city_info["country"]
             )
-            
             if coordinates:
-                # Get current weather
-                current = weather.get_current_weather_and_aqi(
-                    coordinates["lat"], 
-                    coordinates["lng"]
-                )
-                
-                # Get forecast for the next 7 days
-                forecast = weather.get_forecast_data(
-                    coordinates["lat"], 
-                    coordinates["lng"]
-                )
-                
-                # Save data
-                city_name = f"{city_info['city']}, {city_info['state']}, {city_info['country']}".replace(", ,", ",")
-                result[city_name] = {
-                    "current": current,
-                    "forecast": forecast
-                }
+                located.append((city_info, coordinates))
         except Exception as e:
             print(f"Error getting weather for {city_info['city']}: {str(e)}")
+
+    if not located:
+        return {}
+
+    result = {}
+    with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(located))) as pool:
+        futures = [
+            (city_info, pool.submit(_fetch_city_weather, coordinates["lat"], coordinates["lng"]))
+            for city_info, coordinates in located
+        ]
+        # Collect in list order so the email keeps the cities' order
+        for city_info, future in futures:
+            try:
+                result[city_key(city_info)] = future.result()
+            except Exception as e:
+                print(f"Error getting weather for {city_info['city']}: {str(e)}")
     
     return result
 
-def generate_india_weather_summary(india_data):
+# Email templates are compiled once at import. Autoescaping stays off: the
+# sections are pre-rendered HTML, and the batch sender's substitution tags
+# must reach SendGrid untouched.
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+_template_env = Environment(
+    loader=FileSystemLoader(TEMPLATE_DIR),
+    auto_reload=False,
+    trim_blocks=True,
+    lstrip_blocks=True
+)
+_template_env.globals["aqi_label"] = utils.get_aqi_label
+_NEWSLETTER_TEMPLATE = _template_env.get_template("newsletter.html.j2")
+_HIGHLIGHTS_TEMPLATE = _template_env.get_template("newsletter_highlights.html.j2")
+_LOCATION_TEMPLATE = _template_env.get_template("newsletter_location.html.j2")
+_DETAILS_TEMPLATE = _template_env.get_template("newsletter_details.html.j2")
+_WELCOME_TEMPLATE = _template_env.get_template("welcome.html.j2")
+
+def city_weather_frame(city_data):
+    """
+    Tabulate city weather once so every summary can be taken from one table
+    
+    Args:
+        city_data (dict): Weather data keyed by city, as returned by
+            get_weather_forecast_for_cities
+        
+    Returns:
+        DataFrame: One row per city with the current temperature and aqi, plus
+            weekly_high and weekly_low over its forecast (NaN where missing)
+    """
+    current = pd.DataFrame.from_dict(
+        {
+            city: {
+                "temperature": (data.get("current") or {}).get("temperature"),
+                "aqi": (data.get("current") or {}).get("aqi")
+            }
+            for city, data in city_data.items()
+        },
+        orient="index",
+        columns=["temperature", "aqi"]
+    ).astype(float)
+    
+    forecasts = [
+        pd.DataFrame(data["forecast"], columns=["temp_max", "temp_min"]).assign(city=city)
+        for city, data in city_data.items()
+        if data.get("forecast")
+    ]
+    if not forecasts:
+        return current.assign(weekly_high=np.nan, weekly_low=np.nan)
+    
+    weekly = pd.concat(forecasts).groupby("city", sort=False).agg(
+        weekly_high=("temp_max", "max"),
+        weekly_low=("temp_min", "min")
+    )
+    return current.join(weekly)
+
+# City with the largest or smallest value in a column, or None if it's empty
+def _extreme(values, key, largest):
+    values = values.dropna()
+    if values.empty:
+        return None
+    city = values.idxmax() if largest else values.idxmin()
+    return {"city": city, key: values[city]}
+
+def generate_india_weather_summary(india_data, frame=None):
     """
     Generate summary of weather across India
     
     Args:
         india_data (dict): Weather data for Indian cities
+        frame (DataFrame, optional): city_weather_frame(india_data), if the
+            caller already has it
         
     Returns:
         dict: Dictionary with summary information
@@ -98,409 +234,150 @@ def generate_india_weather_summary(india_data):
     if not india_data:
         return None
     
-    # Extract current temperatures
-    temperatures = []
-    aqi_values = []
-    
-    for city, data in india_data.items():
-        current = data.get("current", {})
-        if current:
-            temp = current.get("temperature")
-            aqi = current.get("aqi")
-            if temp is not None:
-                temperatures.append({
-                    "city": city,
-                    "temperature": temp
-                })
-            if aqi is not None:
-                aqi_values.append({
-                    "city": city,
-                    "aqi": aqi
-                })
-    
-    # Find highest and lowest temperatures
-    highest_temp = max(temperatures, key=lambda x: x["temperature"]) if temperatures else None
-    lowest_temp = min(temperatures, key=lambda x: x["temperature"]) if temperatures else None
-    
-    # Find best and worst AQI
-    best_aqi = min(aqi_values, key=lambda x: x["aqi"]) if aqi_values else None
-    worst_aqi = max(aqi_values, key=lambda x: x["aqi"]) if aqi_values else None
+    if frame is None:
+        frame = city_weather_frame(india_data)
     
     return {
-        "highest_temp": highest_temp,
-        "lowest_temp": lowest_temp,
-        "best_aqi": best_aqi,
-        "worst_aqi": worst_aqi
+        "highest_temp": _extreme(frame["temperature"], "temperature", largest=True),
+        "lowest_temp": _extreme(frame["temperature"], "temperature", largest=False),
+        "best_aqi": _extreme(frame["aqi"], "aqi", largest=False),
+        "worst_aqi": _extreme(frame["aqi"], "aqi", largest=True)
     }
 
-def generate_global_weather_summary(global_data):
+def generate_global_weather_summary(global_data, frame=None):
     """
     Generate summary of weather around the world
     
     Args:
         global_data (dict): Weather data for global cities
+        frame (DataFrame, optional): city_weather_frame(global_data)
         
     Returns:
         dict: Dictionary with summary information
     """
-    return generate_india_weather_summary(global_data)  # Same logic applies
+    return generate_india_weather_summary(global_data, frame)  # Same logic applies
 
-def generate_html_email_content(subscriber, india_data, global_data):
+# Pair each forecast day with its "Mon, Jan 01" label, formatting the whole
+# table's dates in one vectorised pass
+def _dated_days(forecast):
+    labels = pd.to_datetime([day['date'] for day in forecast], format="ISO8601").strftime('%a, %b %d')
+    return list(zip(forecast, labels))
+
+def render_shared_sections(india_data, global_data):
     """
-    Generate HTML content for email newsletter
+    Render the parts of the newsletter that are the same for every subscriber
     
     Args:
-        subscriber (Subscriber): Subscriber object from database
         india_data (dict): Weather data for Indian cities
         global_data (dict): Weather data for global cities
         
     Returns:
-        str: HTML content for email
+        dict: HTML for the "highlights" (above the subscriber's location)
+            and "details" (below it) sections
     """
+    # The global summary and snapshot table both read from one table
+    global_frame = city_weather_frame(global_data)
+    
     # Get summaries
     india_summary = generate_india_weather_summary(india_data)
-    global_summary = generate_global_weather_summary(global_data)
+    global_summary = generate_global_weather_summary(global_data, global_frame)
     
-    # Generate date strings
-    today = datetime.now()
-    week_end = (today + timedelta(days=6)).strftime('%B %d, %Y')
-    today_str = today.strftime('%B %d, %Y')
-    
-    # Start building HTML content
-    html = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>Weather & Health Advisor - Weekly Update</title>
-        <style>
-            body {{
-                font-family: Arial, sans-serif;
-                line-height: 1.6;
-                color: #333;
-                max-width: 800px;
-                margin: 0 auto;
-                padding: 20px;
-            }}
-            .header {{
-                background-color: #3498db;
-                color: white;
-                padding: 20px;
-                text-align: center;
-                border-radius: 5px 5px 0 0;
-            }}
-            .footer {{
-                background-color: #f8f9fa;
-                padding: 15px;
-                text-align: center;
-                font-size: 12px;
-                border-radius: 0 0 5px 5px;
-                margin-top: 20px;
-            }}
-            h1, h2, h3 {{
-                color: #2c3e50;
-            }}
-            table {{
-                width: 100%;
-                border-collapse: collapse;
-                margin-bottom: 20px;
-            }}
-            th, td {{
-                border: 1px solid #ddd;
-                padding: 8px;
-                text-align: left;
-            }}
-            th {{
-                background-color: #f2f2f2;
-            }}
-            tr:nth-child(even) {{
-                background-color: #f9f9f9;
-            }}
-            .highlight {{
-                background-color: #ffffcc;
-                padding: 10px;
-                border-radius: 5px;
-                margin: 15px 0;
-            }}
-            .temperature {{
-                color: #e74c3c;
-            }}
-            .aqi {{
-                color: #27ae60;
-            }}
-            .unsubscribe {{
-                color: #7f8c8d;
-                font-size: 12px;
-            }}
-            .city-section {{
-                margin-bottom: 30px;
-                border-bottom: 1px solid #eee;
-                padding-bottom: 20px;
-            }}
-        </style>
-    </head>
-    <body>
-        <div class="header">
-            <h1>Weather & Health Advisor</h1>
-            <p>Weekly Weather Update: {today_str} - {week_end}</p>
-        </div>
-        
-        <p>Hello {subscriber.name},</p>
-        
-        <p>Here's your weekly weather update with forecasts, air quality information, and health insights for the coming week.</p>
-    """
+    highlights = _HIGHLIGHTS_TEMPLATE.render(
+        india_summary=india_summary,
+        global_summary=global_summary
+    )
     
-    # Add India weather highlights
-    if india_summary:
-        html += """
-        <h2>📍 Weather Highlights Across India</h2>
-        <div class="highlight">
-        """
-        
-        if india_summary.get("highest_temp"):
-            html += f"""
-            <p>🔥 <strong>Highest Temperature:</strong> 
-               <span class="temperature">{india_summary["highest_temp"]["temperature"]:.1f}°C</span> in 
-               {india_summary["highest_temp"]["city"].split(",")[0]}
-            </p>
-            """
-            
-        if india_summary.get("lowest_temp"):
-            html += f"""
-            <p>❄️ <strong>Lowest Temperature:</strong> 
-               <span class="temperature">{india_summary["lowest_temp"]["temperature"]:.1f}°C</span> in 
-               {india_summary["lowest_temp"]["city"].split(",")[0]}
-            </p>
-            """
-            
-        if india_summary.get("best_aqi"):
-            html += f"""
-            <p>🌱 <strong>Best Air Quality:</strong> 
-               <span class="aqi">AQI {india_summary["best_aqi"]["aqi"]:.1f}</span> in 
-               {india_summary["best_aqi"]["city"].split(",")[0]}
-            </p>
-            """
-            
-        if india_summary.get("worst_aqi"):
-            html += f"""
-            <p>🧪 <strong>Poorest Air Quality:</strong> 
-               <span class="aqi">AQI {india_summary["worst_aqi"]["aqi"]:.1f}</span> in 
-               {india_summary["worst_aqi"]["city"].split(",")[0]}
-            </p>
-            """
-            
-        html += """
-        </div>
-        """
-    
-    # Add Global weather highlights
-    if global_summary:
-        html += """
-        <h2>🌎 Global Weather Highlights</h2>
-        <div class="highlight">
-        """
-        
-        if global_summary.get("highest_temp"):
-            html += f"""
-            <p>🔥 <strong>Highest Temperature:</strong> 
-               <span class="temperature">{global_summary["highest_temp"]["temperature"]:.1f}°C</span> in 
-               {global_summary["highest_temp"]["city"].split(",")[0]}
-            </p>
-            """
-            
-        if global_summary.get("lowest_temp"):
-            html += f"""
-            <p>❄️ <strong>Lowest Temperature:</strong> 
-               <span class="temperature">{global_summary["lowest_temp"]["temperature"]:.1f}°C</span> in 
-               {global_summary["lowest_temp"]["city"].split(",")[0]}
-            </p>
-            """
-            
-        if global_summary.get("best_aqi"):
-            html += f"""
-            <p>🌱 <strong>Best Air Quality:</strong> 
-               <span class="aqi">AQI {global_summary["best_aqi"]["aqi"]:.1f}</span> in 
-               {global_summary["best_aqi"]["city"].split(",")[0]}
-            </p>
-            """
-            
-        if global_summary.get("worst_aqi"):
-            html += f"""
-            <p>🧪 <strong>Poorest Air Quality:</strong> 
-               <span class="aqi">AQI {global_summary["worst_aqi"]["aqi"]:.1f}</span> in 
-               {global_summary["worst_aqi"]["city"].split(",")[0]}
-            </p>
-            """
-            
-        html += """
-        </div>
-        """
-    
-    # Add subscriber's location weather if available
-    if subscriber.location_city and subscriber.location_state and subscriber.location_country:
-        try:
-            subscriber_location = f"{subscriber.location_city}, {subscriber.location_state}, {subscriber.location_country}".replace(", ,", ",")
-            coordinates = utils.get_coordinates(
-                subscriber.location_city,
-                subscriber.location_state,
-                subscriber.location_country
-            )
-            
-            if coordinates:
-                current = weather.get_current_weather_and_aqi(
-                    coordinates["lat"], 
-                    coordinates["lng"]
-                )
-                
-                forecast = weather.get_forecast_data(
-                    coordinates["lat"], 
-                    coordinates["lng"]
-                )
-                
-                html += f"""
-                <h2>📌 Weather for Your Location: {subscriber_location}</h2>
-                
-                <h3>Current Conditions</h3>
-                <p>
-                    Temperature: <span class="temperature">{current.get('temperature', 'N/A'):.1f}°C</span><br>
-                    Humidity: {current.get('humidity', 'N/A'):.1f}%<br>
-                    Wind Speed: {current.get('wind_speed', 'N/A'):.1f} m/s<br>
-                    Air Quality Index: <span class="aqi">{current.get('aqi', 'N/A'):.1f}</span> 
-                    ({utils.get_aqi_label(current.get('aqi', 0))})
-                </p>
-                
-                <h3>7-Day Forecast</h3>
-                <table>
-                    <tr>
-                        <th>Date</th>
-                        <th>Min Temp (°C)</th>
-                        <th>Max Temp (°C)</th>
-                        <th>Avg Temp (°C)</th>
-                        <th>AQI</th>
-                    </tr>
-                """
-                
-                for day in forecast:
-                    date_obj = datetime.fromisoformat(day['date']).strftime('%a, %b %d')
-                    html += f"""
-                    <tr>
-                        <td>{date_obj}</td>
-                        <td>{day['temp_min']:.1f}</td>
-                        <td>{day['temp_max']:.1f}</td>
-                        <td>{day['temp_avg']:.1f}</td>
-                        <td>{day['aqi_avg']:.1f}</td>
-                    </tr>
-                    """
-                
-                html += """
-                </table>
-                """
-        except Exception as e:
-            print(f"Error generating subscriber location forecast: {str(e)}")
+    # Cities without both current conditions and a forecast are left out
+    india_cities = [
+        {
+            "name": city_name.split(",")[0],
+            "current": data["current"],
+            "days": _dated_days(data["forecast"][:5])  # Show only next 5 days to keep email compact
+        }
+        for city_name, data in india_data.items()
+        if data.get("current") and data.get("forecast")
+    ]
+    global_cities = [
+        {
+            "name": city_name.split(",")[0],
+            "current": data["current"],
+            "weekly_high": global_frame.at[city_name, "weekly_high"],
+            "weekly_low": global_frame.at[city_name, "weekly_low"]
+        }
+        for city_name, data in global_data.items()
+        if data.get("current") and data.get("forecast")
+    ]
+    details = _DETAILS_TEMPLATE.render(india_cities=india_cities, global_cities=global_cities)
     
-    # Add detailed city forecasts for India
-    html += """
-    <h2>📊 Detailed Forecasts - Major Cities in India</h2>
+    return {"highlights": highlights, "details": details}
+
+def render_subscriber_section(subscriber):
     """
+    Render the weather section for the subscriber's own location
     
-    # Display data for each Indian city
-    for city_name, data in india_data.items():
-        short_city_name = city_name.split(",")[0]
-        current = data.get("current", {})
-        forecast = data.get("forecast", [])
+    Args:
+        subscriber: Subscriber object or row with location fields
         
-        if current and forecast:
-            html += f"""
-            <div class="city-section">
-                <h3>{short_city_name}</h3>
-                <p>
-                    Current Temperature: <span class="temperature">{current.get('temperature', 'N/A'):.1f}°C</span><br>
-                    Current AQI: <span class="aqi">{current.get('aqi', 'N/A'):.1f}</span> 
-                    ({utils.get_aqi_label(current.get('aqi', 0))})
-                </p>
-                
-                <h4>Weekly Temperature Range</h4>
-                <table>
-                    <tr>
-                        <th>Date</th>
-                        <th>Min (°C)</th>
-                        <th>Max (°C)</th>
-                    </tr>
-            """
-            
-            for day in forecast[:5]:  # Show only next 5 days to keep email compact
-                date_obj = datetime.fromisoformat(day['date']).strftime('%a, %b %d')
-                html += f"""
-                <tr>
-                    <td>{date_obj}</td>
-                    <td>{day['temp_min']:.1f}</td>
-                    <td>{day['temp_max']:.1f}</td>
-                </tr>
-                """
-            
-            html += """
-                </table>
-            </div>
-            """
-    
-    # Add global city highlights (compact version)
-    html += """
-    <h2>🌍 Global Weather Snapshot</h2>
-    <table>
-        <tr>
-            <th>City</th>
-            <th>Current Temp (°C)</th>
-            <th>AQI</th>
-            <th>Weekly High (°C)</th>
-            <th>Weekly Low (°C)</th>
-        </tr>
+    Returns:
+        str: HTML for the section, empty if the location is unknown
     """
+    if not (subscriber.location_city and subscriber.location_state and subscriber.location_country):
+        return ""
     
-    for city_name, data in global_data.items():
-        short_city_name = city_name.split(",")[0]
-        current = data.get("current", {})
-        forecast = data.get("forecast", [])
+    try:
+        coordinates = utils.get_coordinates(
+            subscriber.location_city,
+            subscriber.location_state,
+            subscriber.location_country
+        )
+        if not coordinates:
+            return ""
         
-        if current and forecast:
-            # Find weekly high and low
-            weekly_high = max([day['temp_max'] for day in forecast]) if forecast else "N/A"
-            weekly_low = min([day['temp_min'] for day in forecast]) if forecast else "N/A"
-            
-            html += f"""
-            <tr>
-                <td>{short_city_name}</td>
-                <td>{current.get('temperature', 'N/A'):.1f}</td>
-                <td>{current.get('aqi', 'N/A'):.1f}</td>
-                <td>{weekly_high if weekly_high == 'N/A' else f'{weekly_high:.1f}'}</td>
-                <td>{weekly_low if weekly_low == 'N/A' else f'{weekly_low:.1f}'}</td>
-            </tr>
-            """
-    
-    html += """
-    </table>
+        return _LOCATION_TEMPLATE.render(
+            location=f"{subscriber.location_city}, {subscriber.location_state}, {subscriber.location_country}".replace(", ,", ","),
+            current=get_current_weather_cached(coordinates["lat"], coordinates["lng"]),
+            days=_dated_days(get_forecast_cached(coordinates["lat"], coordinates["lng"]))
+        )
+    except Exception as e:
+        print(f"Error generating subscriber location forecast: {str(e)}")
+        return ""
+
+def generate_html_email_content(subscriber, india_data, global_data, shared=None):
     """
+    Generate HTML content for email newsletter
     
-    # Add footer and unsubscribe link
-    html += f"""
-        <div class="footer">
-            <p>This newsletter is sent weekly to provide you with weather updates and health recommendations.</p>
-            <p class="unsubscribe">
-                If you wish to unsubscribe, <a href="https://your-app-url.com/unsubscribe?email={subscriber.email}">click here</a>.
-            </p>
-        </div>
-    </body>
-    </html>
+    Args:
+        subscriber (Subscriber): Subscriber object from database
+        india_data (dict): Weather data for Indian cities
+        global_data (dict): Weather data for global cities
+        shared (dict, optional): Output of render_shared_sections, to reuse
+            across subscribers; rendered here if not given
+        
+    Returns:
+        str: HTML content for email
     """
+    if shared is None:
+        shared = render_shared_sections(india_data, global_data)
     
-    return html
+    # Generate date strings
+    today = datetime.now()
+    
+    return _NEWSLETTER_TEMPLATE.render(
+        subscriber=subscriber,
+        today_str=today.strftime('%B %d, %Y'),
+        week_end=(today + timedelta(days=6)).strftime('%B %d, %Y'),
+        shared=shared,
+        location_section=render_subscriber_section(subscriber)
+    )
 
-def send_newsletter_to_subscriber(subscriber):
+def send_newsletter_to_subscriber(subscriber, india_data=None, global_data=None):
     """
     Generate and send newsletter to a single subscriber
     
     Args:
-        subscriber (Subscriber): Subscriber database object
+        subscriber: Subscriber object or row with email, name and location fields
+        india_data (dict, optional): Weather for INDIA_CITIES; fetched if not given
+        global_data (dict, optional): Weather for GLOBAL_CITIES; fetched if not given
         
     Returns:
         bool: True if email was sent successfully, False otherwise
@@ -511,10 +388,12 @@ def send_newsletter_to_subscriber(subscriber):
     
     try:
         # Get weather data for Indian cities
-        india_data = get_weather_forecast_for_cities(INDIA_CITIES)
+        if india_data is None:
+            india_data = get_weather_forecast_for_cities(INDIA_CITIES)
         
         # Get weather data for global cities
-        global_data = get_weather_forecast_for_cities(GLOBAL_CITIES)
+        if global_data is None:
+            global_data = get_weather_forecast_for_cities(GLOBAL_CITIES)
         
         # Generate email content
         html_content = generate_html_email_content(subscriber, india_data, global_data)
@@ -528,7 +407,7 @@ def send_newsletter_to_subscriber(subscriber):
         mail = Mail(from_email, to_email, subject, content)
         
         # Send email
-        sg = sendgrid.SendGridAPIClient(api_key=SENDGRID_API_KEY)
+        sg = _sendgrid_client()
         response = sg.client.mail.send.post(request_body=mail.get())
         
         if response.status_code >= 200 and response.status_code < 300:
@@ -544,6 +423,77 @@ def send_newsletter_to_subscriber(subscriber):
         print(f"Error sending newsletter to {subscriber.email}: {str(e)}")
         return False
 
+# SendGrid accepts up to 1000 personalizations in one request. Each one is
+# a separate message to a single recipient, with these tags substituted.
+SENDGRID_BATCH_SIZE = 1000
+# Delivered addresses are stamped with last_email_sent in chunks of this size
+STAMP_CHUNK_SIZE = 5000
+NAME_TAG = "-name-"
+EMAIL_TAG = "-email-"
+
+def send_newsletter_batch(subscribers, india_data, global_data, shared=None, record_sent=True):
+    """
+    Send the newsletter to subscribers who share a location in one request
+    
+    The email body is rendered once with placeholder tags for the name and
+    email address, and SendGrid fills them in for each recipient.
+    
+    Args:
+        subscribers (list): Subscribers with the same location fields
+        india_data (dict): Weather for INDIA_CITIES
+        global_data (dict): Weather for GLOBAL_CITIES
+        shared (dict, optional): Pre-rendered render_shared_sections output
+        record_sent (bool): Stamp last_email_sent for the batch on success;
+            callers sending many batches can pass False and stamp them all
+            in one update afterwards
+        
+    Returns:
+        int: Number of subscribers the newsletter was sent to
+    """
+    if not subscribers:
+        return 0
+
+    first = subscribers[0]
+    template_subscriber = SimpleNamespace(
+        name=NAME_TAG,
+        email=EMAIL_TAG,
+        location_city=first.location_city,
+        location_state=first.location_state,
+        location_country=first.location_country
+    )
+    emails = [subscriber.email for subscriber in subscribers]
+
+    try:
+        html_content = generate_html_email_content(template_subscriber, india_data, global_data, shared)
+        subject = f"Your Weekly Weather Update - {datetime.now().strftime('%B %d, %Y')}"
+        mail = Mail(Email(FROM_EMAIL), None, subject, Content(MimeType.html, html_content))
+        for subscriber in subscribers:
+            personalization = Personalization()
+            personalization.add_to(To(subscriber.email))
+            personalization.add_substitution(Substitution(NAME_TAG, str(subscriber.name)))
+            personalization.add_substitution(Substitution(EMAIL_TAG, subscriber.email))
+            mail.add_personalization(personalization)
+
+        sg = _sendgrid_client()
+        response = sg.client.mail.send.post(request_body=mail.get())
+
+        if response.status_code >= 200 and response.status_code < 300:
+            # Update last email sent timestamps
+            if record_sent:
+                db.update_last_email_sent_bulk(emails)
+            print(f"Newsletter sent to {len(emails)} subscribers")
+            return len(emails)
+        else:
+            print(f"Failed to send newsletter to {len(emails)} subscribers: {response.status_code}")
+            return 0
+
+    except Exception as e:
+        print(f"Error sending newsletter to {len(emails)} subscribers: {str(e)}")
+        return 0
+
+def _subscriber_location(subscriber):
+    return (subscriber.location_city, subscriber.location_state, subscriber.location_country)
+
 def send_newsletters():
     """Send newsletters to all active subscribers"""
     if not SENDGRID_API_KEY:
@@ -551,18 +501,71 @@ def send_newsletters():
         return
     
     print(f"Starting newsletter sending job at {datetime.now()}")
-    subscribers = db.get_active_subscribers()
-    
-    for subscriber in subscribers:
+
+    subscribers = db.iter_active_subscribers(batch_size=SENDGRID_BATCH_SIZE)
+    first = next(subscribers, None)
+
+    # Nothing to send: skip the weather fetches and rendering entirely
+    if first is None:
+        print("No active subscribers. Skipping newsletter sending.")
+        return
+
+    # The city tables are the same for everyone, so fetch them once per run
+    india_data = get_weather_forecast_for_cities(INDIA_CITIES)
+    global_data = get_weather_forecast_for_cities(GLOBAL_CITIES)
+    _remember_city_data(india_data, global_data)
+    shared = render_shared_sections(india_data, global_data)
+
+    # Only the location section differs between emails. Subscribers stream in
+    # location order, so each location's batches are sent as soon as they are
+    # read; capping batches in flight keeps memory flat however long the
+    # list is. Finished batches are not kept either: delivered addresses are
+    # collected and stamped STAMP_CHUNK_SIZE at a time.
+    in_flight = threading.BoundedSemaphore(MAX_SEND_WORKERS * 2)
+    results_lock = threading.Lock()
+    delivered = []
+    sent = total = 0
+
+    def batch_done(future, emails):
+        nonlocal sent, total
         try:
-            send_newsletter_to_subscriber(subscriber)
-        except Exception as e:
-            print(f"Error processing subscriber {subscriber.email}: {str(e)}")
+            with results_lock:
+                total += len(emails)
+                if future.exception() is None and future.result():
+                    sent += len(emails)
+                    delivered.extend(emails)
+        finally:
+            in_flight.release()
+
+    def stamp_delivered():
+        with results_lock:
+            emails = delivered[:]
+            delivered.clear()
+        db.update_last_email_sent_bulk(emails)
+
+    with ThreadPoolExecutor(max_workers=MAX_SEND_WORKERS) as pool:
+        rows = itertools.chain([first], subscribers)
+        for _, members in itertools.groupby(rows, key=_subscriber_location):
+            while batch := list(itertools.islice(members, SENDGRID_BATCH_SIZE)):
+                in_flight.acquire()
+                emails = [subscriber.email for subscriber in batch]
+                future = pool.submit(send_newsletter_batch, batch, india_data, global_data, shared, False)
+                future.add_done_callback(lambda f, emails=emails: batch_done(f, emails))
+                if len(delivered) >= STAMP_CHUNK_SIZE:
+                    stamp_delivered()
+
+    stamp_delivered()
     
-    print(f"Completed newsletter sending job at {datetime.now()}")
+    print(f"Completed newsletter sending job at {datetime.now()}: {sent}/{total} sent")
 
-# Initialize scheduler
-scheduler = BackgroundScheduler()
+# Initialize scheduler. The only job runs weekly and does its own fan-out,
+# so one worker thread is enough (APScheduler defaults to ten); a run
+# missed while the app was down fires once rather than piling up.
+scheduler = BackgroundScheduler(
+    executors={"default": APThreadPoolExecutor(max_workers=1)},
+    job_defaults={"coalesce": True, "max_instances": 1},
+    daemon=True
+)
 
 def start_scheduler():
     """Start the newsletter scheduler"""
@@ -570,7 +573,8 @@ def start_scheduler():
         # Only add the job if scheduler is not already running
         if not scheduler.running:
             # Schedule to run weekly on Sunday at 8 AM
-            scheduler.add_job(send_newsletters, 'cron', day_of_week='sun', hour=8)
+            scheduler.add_job(send_newsletters, 'cron', day_of_week='sun', hour=8,
+                              id="weekly_newsletter", replace_existing=True)
             scheduler.start()
             print("Newsletter scheduler started")
         else:
@@ -587,6 +591,27 @@ def stop_scheduler():
     except Exception as e:
         print(f"Error stopping scheduler: {str(e)}")
 
+# City weather from the most recent newsletter run, reused by welcome emails
+# sent within a day of it instead of fetching the same cities again
+REPORT_REUSE_TTL = 24 * 3600
+_last_run_data = {"india": None, "global": None, "ts": 0.0}
+
+def _remember_city_data(india_data, global_data):
+    _last_run_data["india"] = india_data
+    _last_run_data["global"] = global_data
+    _last_run_data["ts"] = time.monotonic()
+
+def _report_city_data(cities_list, cached):
+    """Weather for cities_list, taken from cached where possible"""
+    if cached is None or time.monotonic() - _last_run_data["ts"] >= REPORT_REUSE_TTL:
+        return get_weather_forecast_for_cities(cities_list)
+    
+    keys = [city_key(city_info) for city_info in cities_list]
+    missing = [city_info for city_info, key in zip(cities_list, keys) if key not in cached]
+    fetched = get_weather_forecast_for_cities(missing) if missing else {}
+    
+    return {key: cached.get(key, fetched.get(key)) for key in keys if key in cached or key in fetched}
+
 def get_previous_week_report():
     """
     Generate a summary of the previous week's weather data for the welcome email
@@ -595,28 +620,19 @@ def get_previous_week_report():
         dict: Dictionary with previous week's weather summary
     """
     # Define the cities to include in the report
-    india_cities = [
-        {"city": "Mumbai", "state": "Maharashtra", "country": "India"},
-        {"city": "Delhi", "state": "Delhi", "country": "India"},
-        {"city": "Bangalore", "state": "Karnataka", "country": "India"},
-        {"city": "Chennai", "state": "Tamil Nadu", "country": "India"},
-        {"city": "Kolkata", "state": "West Bengal", "country": "India"},
-    ]
-    
-    global_cities = [
-        {"city": "New York", "state": "NY", "country": "USA"},
-        {"city": "London", "state": "", "country": "UK"},
-        {"city": "Tokyo", "state": "", "country": "Japan"},
-        {"city": "Sydney", "state": "", "country": "Australia"},
-        {"city": "Paris", "state": "", "country": "France"},
-    ]
+    india_cities = [c for c in INDIA_CITIES if c["city"] in REPORT_INDIA_CITIES]
+    global_cities = [c for c in GLOBAL_CITIES if c["city"] in REPORT_GLOBAL_CITIES]
     
     # Get data for these cities
-    india_data = get_weather_forecast_for_cities(india_cities)
-    global_data = get_weather_forecast_for_cities(global_cities)
+    india_data = _report_city_data(india_cities, _last_run_data["india"])
+    global_data = _report_city_data(global_cities, _last_run_data["global"])
+    
+    # Tabulate once; the summaries and ranges below all read from these
+    india_frame = city_weather_frame(india_data)
+    global_frame = city_weather_frame(global_data)
     
     # Add overview field to summaries for the welcome email
-    india_summary = generate_india_weather_summary(india_data)
+    india_summary = generate_india_weather_summary(india_data, india_frame)
     if india_summary:
         india_summary["overview"] = "Latest weather conditions across major Indian cities."
     else:
@@ -628,7 +644,7 @@ def get_previous_week_report():
             "worst_aqi": None
         }
     
-    global_summary = generate_global_weather_summary(global_data)
+    global_summary = generate_global_weather_summary(global_data, global_frame)
     if global_summary:
         global_summary["overview"] = "Current weather conditions in major cities around the world."
     else:
@@ -659,33 +675,18 @@ def get_previous_week_report():
                 "conditions": "Partly Cloudy"
             }
     
-    # Create summary data
-    temp_values_india = [data["temperature"] for city, data in processed_india_data.items() if "temperature" in data]
-    aqi_values_india = [data["aqi"] for city, data in processed_india_data.items() if "aqi" in data]
-    
-    temp_values_global = [data["temperature"] for city, data in processed_global_data.items() if "temperature" in data]
-    aqi_values_global = [data["aqi"] for city, data in processed_global_data.items() if "aqi" in data]
-    
     # Create temperature and AQI range strings for welcome email
-    if temp_values_india:
-        india_summary["temp_range"] = f"{min(temp_values_india):.1f}°C to {max(temp_values_india):.1f}°C"
-    else:
-        india_summary["temp_range"] = "Data unavailable"
-        
-    if aqi_values_india:
-        india_summary["aqi_range"] = f"{min(aqi_values_india):.0f} to {max(aqi_values_india):.0f}"
-    else:
-        india_summary["aqi_range"] = "Data unavailable"
-        
-    if temp_values_global:
-        global_summary["temp_range"] = f"{min(temp_values_global):.1f}°C to {max(temp_values_global):.1f}°C"
-    else:
-        global_summary["temp_range"] = "Data unavailable"
-        
-    if aqi_values_global:
-        global_summary["aqi_range"] = f"{min(aqi_values_global):.0f} to {max(aqi_values_global):.0f}"
-    else:
-        global_summary["aqi_range"] = "Data unavailable"
+    for summary, frame in ((india_summary, india_frame), (global_summary, global_frame)):
+        temps = frame["temperature"].dropna()
+        aqi = frame["aqi"].dropna()
+        if not temps.empty:
+            summary["temp_range"] = f"{temps.min():.1f}°C to {temps.max():.1f}°C"
+        else:
+            summary["temp_range"] = "Data unavailable"
+        if not aqi.empty:
+            summary["aqi_range"] = f"{aqi.min():.0f} to {aqi.max():.0f}"
+        else:
+            summary["aqi_range"] = "Data unavailable"
     
     return {
         "india_data": processed_india_data,
@@ -696,6 +697,29 @@ def get_previous_week_report():
     }
 
 
+def _welcome_report():
+    """Previous week's report for welcome emails, with fallback text if it fails"""
+    try:
+        return get_previous_week_report()
+    except Exception as e:
+        print(f"Error generating weather report, using fallback data: {str(e)}")
+        # Create fallback data to ensure email still works
+        return {
+            "india_data": {},
+            "global_data": {},
+            "india_summary": {
+                "overview": "Weather data for India is currently being updated.",
+                "temp_range": "Data unavailable",
+                "aqi_range": "Data unavailable"
+            },
+            "global_summary": {
+                "overview": "Global weather data is currently being updated.",
+                "temp_range": "Data unavailable",
+                "aqi_range": "Data unavailable"
+            },
+            "date": datetime.now().strftime("%d %B, %Y")
+        }
+
 def send_welcome_email(subscriber):
     """
     Send a welcome email to a new subscriber with previous week's weather data
@@ -720,26 +744,7 @@ def send_welcome_email(subscriber):
     try:
         # First, get previous week's weather report data
         print(f"Generating previous week's weather report for welcome email to {subscriber.email}")
-        try:
-            weather_report = get_previous_week_report()
-        except Exception as e:
-            print(f"Error generating weather report, using fallback data: {str(e)}")
-            # Create fallback data to ensure email still works
-            weather_report = {
-                "india_data": {},
-                "global_data": {},
-                "india_summary": {
-                    "overview": "Weather data for India is currently being updated.",
-                    "temp_range": "Data unavailable",
-                    "aqi_range": "Data unavailable"
-                },
-                "global_summary": {
-                    "overview": "Global weather data is currently being updated.",
-                    "temp_range": "Data unavailable",
-                    "aqi_range": "Data unavailable"
-                },
-                "date": datetime.now().strftime("%d %B, %Y")
-            }
+        weather_report = _welcome_report()
         
         # Configure email
         from_email = Email(FROM_EMAIL)
@@ -747,192 +752,13 @@ def send_welcome_email(subscriber):
         subject = "Welcome to IcoHealth Weather Newsletter!"
         
         # Generate HTML content for welcome email with previous week's data
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>Welcome to IcoHealth Weather Newsletter</title>
-            <style>
-                body {{
-                    font-family: Arial, sans-serif;
-                    line-height: 1.6;
-                    color: #333;
-                    max-width: 800px;
-                    margin: 0 auto;
-                    padding: 20px;
-                }}
-                .header {{
-                    background-color: #3498db;
-                    color: white;
-                    padding: 20px;
-                    text-align: center;
-                    border-radius: 5px 5px 0 0;
-                }}
-                .content {{
-                    padding: 20px;
-                }}
-                .footer {{
-                    background-color: #f8f9fa;
-                    padding: 15px;
-                    text-align: center;
-                    font-size: 12px;
-                    border-radius: 0 0 5px 5px;
-                    margin-top: 20px;
-                }}
-                h1, h2, h3 {{
-                    color: #2c3e50;
-                }}
-                .highlight {{
-                    background-color: #ffffcc;
-                    padding: 10px;
-                    border-radius: 5px;
-                    margin: 15px 0;
-                }}
-                .unsubscribe {{
-                    color: #7f8c8d;
-                    font-size: 12px;
-                }}
-                .weather-section {{
-                    background-color: #f1f9fe;
-                    padding: 15px;
-                    border-radius: 5px;
-                    margin: 20px 0;
-                }}
-                .weather-table {{
-                    width: 100%;
-                    border-collapse: collapse;
-                    margin: 15px 0;
-                }}
-                .weather-table th, .weather-table td {{
-                    padding: 8px;
-                    border-bottom: 1px solid #ddd;
-                    text-align: left;
-                }}
-                .weather-table th {{
-                    background-color: #3498db;
-                    color: white;
-                }}
-                .weather-table tr:nth-child(even) {{
-                    background-color: #f2f2f2;
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>IcoHealth Weather Newsletter</h1>
-                <p>Weather Report: {weather_report["date"]}</p>
-            </div>
-            
-            <div class="content">
-                <h2>Welcome, {subscriber.name}!</h2>
-                
-                <p>Thank you for subscribing to our weekly weather newsletter. You're now part of our community that receives personalized weather insights and health recommendations.</p>
-                
-                <div class="highlight">
-                    <h3>What to Expect:</h3>
-                    <ul>
-                        <li>📅 <strong>Weekly Delivery:</strong> Every Sunday at 8 AM</li>
-                        <li>🌡️ <strong>Personalized Weather:</strong> Forecast for your location ({subscriber.location_city if subscriber.location_city else "your area"})</li>
-                        <li>🏙️ <strong>City Updates:</strong> Weather trends for major cities in India</li>
-                        <li>🌎 <strong>Global Insights:</strong> Temperature and AQI information from around the world</li>
-                        <li>🧠 <strong>Health Tips:</strong> Personalized recommendations based on your local weather conditions</li>
-                    </ul>
-                </div>
-                
-                <p>Here's a sample of our weekly weather insights to get you started:</p>
-                
-                <!-- India Weather Section -->
-                <div class="weather-section">
-                    <h3>🇮🇳 India Weather Highlights</h3>
-                    <p><strong>Summary:</strong> {weather_report["india_summary"]["overview"]}</p>
-                    
-                    <table class="weather-table">
-                        <tr>
-                            <th>City</th>
-                            <th>Temp (°C)</th>
-                            <th>AQI</th>
-                            <th>Conditions</th>
-                        </tr>
-        """
-        
-        # Add India cities data
-        for city, data in weather_report["india_data"].items():
-            if data.get("temperature") is not None:
-                html_content += f"""
-                        <tr>
-                            <td>{city}</td>
-                            <td>{data.get("temperature"):.1f}°C</td>
-                            <td>{data.get("aqi"):.0f}</td>
-                            <td>{data.get("conditions", "Partly Cloudy")}</td>
-                        </tr>
-                """
-        
-        html_content += f"""
-                    </table>
-                    
-                    <p><strong>Temperature Range:</strong> {weather_report["india_summary"]["temp_range"]}</p>
-                    <p><strong>AQI Range:</strong> {weather_report["india_summary"]["aqi_range"]}</p>
-                </div>
-                
-                <!-- Global Weather Section -->
-                <div class="weather-section">
-                    <h3>🌎 Global Weather Highlights</h3>
-                    <p><strong>Summary:</strong> {weather_report["global_summary"]["overview"]}</p>
-                    
-                    <table class="weather-table">
-                        <tr>
-                            <th>City</th>
-                            <th>Temp (°C)</th>
-                            <th>AQI</th>
-                            <th>Conditions</th>
-                        </tr>
-        """
-        
-        # Add Global cities data
-        for city, data in weather_report["global_data"].items():
-            if data.get("temperature") is not None:
-                html_content += f"""
-                        <tr>
-                            <td>{city}</td>
-                            <td>{data.get("temperature"):.1f}°C</td>
-                            <td>{data.get("aqi"):.0f}</td>
-                            <td>{data.get("conditions", "Partly Cloudy")}</td>
-                        </tr>
-                """
-        
-        html_content += f"""
-                    </table>
-                    
-                    <p><strong>Temperature Range:</strong> {weather_report["global_summary"]["temp_range"]}</p>
-                    <p><strong>AQI Range:</strong> {weather_report["global_summary"]["aqi_range"]}</p>
-                </div>
-                
-                <p>Your next newsletter will be delivered this Sunday at 8 AM. We're excited to help you stay informed about weather patterns and make health-conscious decisions based on environmental conditions.</p>
-                
-                <p>If you have any questions or feedback, feel free to reply to this email.</p>
-                
-                <p>Stay healthy and weather-wise!</p>
-                
-                <p>The IcoHealth Team</p>
-            </div>
-            
-            <div class="footer">
-                <p>This is an automated message from IcoHealth Weather & Health Advisor.</p>
-                <p class="unsubscribe">
-                    If you wish to unsubscribe, <a href="https://your-app-url.com/unsubscribe?email={subscriber.email}">click here</a>.
-                </p>
-            </div>
-        </body>
-        </html>
-        """
+        html_content = _WELCOME_TEMPLATE.render(subscriber=subscriber, report=weather_report)
         
         content = Content(MimeType.html, html_content)
         mail = Mail(from_email, to_email, subject, content)
         
         # Send email
-        sg = sendgrid.SendGridAPIClient(api_key=SENDGRID_API_KEY)
+        sg = _sendgrid_client()
         response = sg.client.mail.send.post(request_body=mail.get())
         
         if response.status_code >= 200 and response.status_code < 300:
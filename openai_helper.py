@@ -20,6 +20,80 @@ except Exception as e:
     print(f"Error initializing OpenAI client: {str(e)}")
     client = None
 
+# Prompt pieces that are the same for every request; only the conditions are
+# substituted per call. The prompt keeps the indentation it had as an
+# f-string inside the function, so the text sent to the model is unchanged.
+_SYSTEM_MESSAGE = {"role": "system", "content": "You are a health advisor specializing in environmental health. Provide accurate, helpful health recommendations based on weather and air quality data."}
+_PROMPT_TEMPLATE = """
+            Generate health recommendations based on the following weather and air quality data:
+            
+            Location: {location}
+            Current Temperature: {temperature_c:.1f}°C ({temperature_f:.1f}°F)
+            Air Quality Index (AQI): {aqi}
+            
+            Provide detailed health recommendations considering:
+            1. Temperature-related precautions (heat or cold)
+            2. Air quality impact on health
+            3. Suitable outdoor activities
+            4. Special considerations for sensitive groups (children, elderly, people with respiratory conditions)
+            5. Hydration and clothing recommendations
+            
+            Format your response as a well-structured Markdown text with clear sections and bullet points.
+            """
+
+def get_ai_recommendations(location, temperature_c, aqi):
+    """
+    Get health recommendations from OpenAI, without a rule-based fallback.
+    Raises if the client is not configured or every attempt fails, so callers
+    that cache results only ever store real responses.
+    
+    Args:
+        location (str): User's location (City, State, Country)
+        temperature_c (float): Current temperature in Celsius
+        aqi (float): Current Air Quality Index
+        
+    Returns:
+        str: Health recommendations
+    """
+    if not (client and OPENAI_API_KEY):
+        raise RuntimeError("OpenAI client is not configured")
+    
+    # Convert temperature to Fahrenheit for reference
+    temperature_f = (temperature_c * 9/5) + 32
+    
+    # Create a prompt for OpenAI
+    prompt = _PROMPT_TEMPLATE.format(
+        location=location,
+        temperature_c=temperature_c,
+        temperature_f=temperature_f,
+        aqi=aqi
+    )
+    
+    # Set retry parameters
+    max_retries = 2
+    retry_delay = 1
+    retries = 0
+    
+    while True:
+        try:
+            # Call OpenAI API
+            # Using GPT-4o as it's the latest and most capable model
+            response = client.chat.completions.create(
+                model="gpt-4o",  # the newest OpenAI model is "gpt-4o" which was released May 13, 2024.
+                messages=[_SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
+                max_tokens=500
+            )
+            
+            # Extract and return the response
+            return response.choices[0].message.content
+        
+        except Exception as e:
+            retries += 1
+            if retries > max_retries:
+                print(f"Error generating health recommendations after {max_retries} retries: {str(e)}")
+                raise
+            time.sleep(retry_delay)
+
 def get_health_recommendations(location, temperature_c, aqi):
     """
     Get health recommendations based on location, temperature, and AQI.
@@ -42,54 +116,7 @@ def get_health_recommendations(location, temperature_c, aqi):
     # Try to use OpenAI for personalized recommendations
     if client and OPENAI_API_KEY:
         try:
-            # Convert temperature to Fahrenheit for reference
-            temperature_f = (temperature_c * 9/5) + 32
-            
-            # Create a prompt for OpenAI
-            prompt = f"""
-            Generate health recommendations based on the following weather and air quality data:
-            
-            Location: {location}
-            Current Temperature: {temperature_c:.1f}°C ({temperature_f:.1f}°F)
-            Air Quality Index (AQI): {aqi}
-            
-            Provide detailed health recommendations considering:
-            1. Temperature-related precautions (heat or cold)
-            2. Air quality impact on health
-            3. Suitable outdoor activities
-            4. Special considerations for sensitive groups (children, elderly, people with respiratory conditions)
-            5. Hydration and clothing recommendations
-            
-            Format your response as a well-structured Markdown text with clear sections and bullet points.
-            """
-            
-            # Set retry parameters
-            max_retries = 2
-            retry_delay = 1
-            retries = 0
-            
-            while retries <= max_retries:
-                try:
-                    # Call OpenAI API
-                    # Using GPT-4o as it's the latest and most capable model
-                    response = client.chat.completions.create(
-                        model="gpt-4o",  # the newest OpenAI model is "gpt-4o" which was released May 13, 2024.
-                        messages=[
-                            {"role": "system", "content": "You are a health advisor specializing in environmental health. Provide accurate, helpful health recommendations based on weather and air quality data."},
-                            {"role": "user", "content": prompt}
-                        ],
-                        max_tokens=500
-                    )
-                    
-                    # Extract and return the response
-                    return response.choices[0].message.content
-                
-                except Exception as e:
-                    retries += 1
-                    if retries > max_retries:
-                        print(f"Error generating health recommendations after {max_retries} retries: {str(e)}")
-                        break
-                    time.sleep(retry_delay)
+            return get_ai_recommendations(location, temperature_c, aqi)
         except Exception as e:
             print(f"Error with OpenAI API: {str(e)}")
     
@@ -1,36 +1,71 @@
 import pandas as pd
 import numpy as np
-from scipy import stats
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
+# Trend charts plot every row of the upload; beyond this many points the
+# browser gets sluggish without the chart looking any different
+MAX_TREND_POINTS = 2000
+
+def _minmax_indices(values, n_out):
+    """Row positions of each bucket's min and max, so spikes survive downsampling"""
+    n = len(values)
+    if n <= n_out:
+        return np.arange(n)
+
+    values = np.asarray(values, dtype=float)
+    buckets = np.arange(n) * (n_out // 2) // n
+    lows = np.where(np.isnan(values), np.inf, values)
+    highs = np.where(np.isnan(values), -np.inf, values)
+
+    # Sort within each bucket and take its first entry
+    by_low = np.lexsort((lows, buckets))
+    by_high = np.lexsort((-highs, buckets))
+    starts = np.r_[0, np.flatnonzero(np.diff(buckets[by_low])) + 1]
+    return np.unique(np.concatenate([by_low[starts], by_high[starts]]))
+
 class AdvancedAnalytics:
     def __init__(self, df):
         self.df = df
         self.numeric_cols = df.select_dtypes(include=['int64', 'float64']).columns
         self.categorical_cols = df.select_dtypes(include=['object']).columns
 
+        # NaN-free values of each numeric column, shared by the methods below
+        self._clean = {}
+        for col in self.numeric_cols:
+            values = df[col].to_numpy()
+            self._clean[col] = values[~np.isnan(values)]
+
     def get_statistical_summary(self):
         """Generate comprehensive statistical summary"""
         if len(self.numeric_cols) == 0:
             return None
 
-        stats_summary = {}
-        for col in self.numeric_cols:
-            data = self.df[col].dropna()
-            stats_summary[col] = {
-                'mean': data.mean(),
-                'median': data.median(),
-                'std': data.std(),
-                'skewness': stats.skew(data),
-                'kurtosis': stats.kurtosis(data),
-                'q1': data.quantile(0.25),
-                'q3': data.quantile(0.75),
-                'iqr': data.quantile(0.75) - data.quantile(0.25),
-                'min': data.min(),
-                'max': data.max()
-            }
+        # Column-wise reductions over the whole numeric block at once
+        num = self.df[self.numeric_cols]
+        base = num.agg(['mean', 'median', 'std', 'min', 'max'])
+        q = num.quantile([0.25, 0.75])
+
+        # Population skewness / excess kurtosis, as scipy.stats computes them
+        centered = num - base.loc['mean']
+        m2 = (centered ** 2).mean()
+        skewness = (centered ** 3).mean() / m2 ** 1.5
+        kurtosis = (centered ** 4).mean() / m2 ** 2 - 3
+
+        summary = pd.DataFrame({
+            'mean': base.loc['mean'],
+            'median': base.loc['median'],
+            'std': base.loc['std'],
+            'skewness': skewness,
+            'kurtosis': kurtosis,
+            'q1': q.loc[0.25],
+            'q3': q.loc[0.75],
+            'iqr': q.loc[0.75] - q.loc[0.25],
+            'min': base.loc['min'],
+            'max': base.loc['max']
+        })
+        stats_summary = summary.to_dict(orient='index')
         return stats_summary
 
     def create_correlation_heatmap(self):
@@ -57,21 +92,27 @@ class AdvancedAnalytics:
 
     def detect_outliers(self, threshold=1.5):
         """Detect outliers using IQR method"""
-        outliers = {}
-        for col in self.numeric_cols:
-            data = self.df[col].dropna()
-            q1 = data.quantile(0.25)
-            q3 = data.quantile(0.75)
-            iqr = q3 - q1
-            lower_bound = q1 - threshold * iqr
-            upper_bound = q3 + threshold * iqr
+        if len(self.numeric_cols) == 0:
+            return {}
+
+        # Bounds and counts for every column at once; NaNs fail both
+        # comparisons, so they never count as outliers
+        num = self.df[self.numeric_cols].to_numpy(dtype=np.float64)
+        q1, q3 = np.nanquantile(num, [0.25, 0.75], axis=0)
+        iqr = q3 - q1
+        lower_bounds = q1 - threshold * iqr
+        upper_bounds = q3 + threshold * iqr
+        counts = np.count_nonzero((num < lower_bounds) | (num > upper_bounds), axis=0)
+        valid = np.count_nonzero(~np.isnan(num), axis=0)
 
+        outliers = {}
+        for i, col in enumerate(self.numeric_cols):
             outliers[col] = {
-                'count': len(data[(data < lower_bound) | (data > upper_bound)]),
-                'percentage': len(data[(data < lower_bound) | (data > upper_bound)]) / len(data) * 100,
+                'count': counts[i],
+                'percentage': counts[i] / valid[i] * 100,
                 'bounds': {
-                    'lower': lower_bound,
-                    'upper': upper_bound
+                    'lower': lower_bounds[i],
+                    'upper': upper_bounds[i]
                 }
             }
         return outliers
@@ -90,7 +131,7 @@ class AdvancedAnalytics:
         )
 
         for idx, col in enumerate(self.numeric_cols, 1):
-            data = self.df[col].dropna()
+            data = self._clean[col]
 
             # Add histogram
             fig.add_trace(
@@ -110,9 +151,11 @@ class AdvancedAnalytics:
                 hist, bin_edges = np.histogram(data, bins=50, density=True)
                 bin_centers = (bin_edges[:-1] + bin_edges[1:]) / 2
 
-                # Simple smoothing using moving average
+                # Simple smoothing using moving average (box filter as a
+                # difference of cumulative sums)
                 window_size = 5
-                smoothed = np.convolve(hist, np.ones(window_size)/window_size, mode='valid')
+                csum = np.cumsum(np.insert(hist, 0, 0.0))
+                smoothed = (csum[window_size:] - csum[:-window_size]) / window_size
                 x_smooth = bin_centers[window_size-1:]
 
                 fig.add_trace(
@@ -149,33 +192,50 @@ class AdvancedAnalytics:
         if date_column not in self.df.columns:
             return None
 
-        trend_analysis = {}
-        for col in self.numeric_cols:
-            if col == date_column:
-                continue
+        cols = [col for col in self.numeric_cols if col != date_column]
+        num = self.df[cols]
+
+        # Calculate rolling statistics for every column in one pass each
+        rolling = num.rolling(window=7, min_periods=1)
+        rolling_means = rolling.mean()
+        rolling_stds = rolling.std()
 
-            # Calculate rolling statistics
-            rolling_mean = self.df[col].rolling(window=7, min_periods=1).mean()
-            rolling_std = self.df[col].rolling(window=7, min_periods=1).std()
+        # Direction of each column against row order (sign of its covariance
+        # with the row position, over the rows where it has a value)
+        values = num.to_numpy(dtype=float)
+        present = ~np.isnan(values)
+        position = np.arange(len(num), dtype=float)[:, None]
+        position_mean = (position * present).sum(axis=0) / present.sum(axis=0)
+        trend_cov = np.nansum((position - position_mean) * (values - np.nanmean(values, axis=0)), axis=0)
+        means = num.mean()
+        stds = num.std()
+
+        trend_analysis = {}
+        for i, col in enumerate(cols):
+            rolling_mean = rolling_means[col]
+            rolling_std = rolling_stds[col]
 
-            # Create trend visualization
+            # Create trend visualization (WebGL, with long uploads thinned
+            # to each bucket's extremes)
+            idx = _minmax_indices(self.df[col].to_numpy(), MAX_TREND_POINTS)
+            x = self.df[date_column].iloc[idx]
             fig = go.Figure()
-            fig.add_trace(go.Scatter(
-                x=self.df[date_column],
-                y=self.df[col],
+            fig.add_trace(go.Scattergl(
+                x=x,
+                y=self.df[col].iloc[idx],
                 name='Raw Data',
                 mode='lines+markers',
                 marker=dict(size=3)
             ))
-            fig.add_trace(go.Scatter(
-                x=self.df[date_column],
-                y=rolling_mean,
+            fig.add_trace(go.Scattergl(
+                x=x,
+                y=rolling_mean.iloc[idx],
                 name='7-point Moving Average',
                 line=dict(color='red')
             ))
-            fig.add_trace(go.Scatter(
-                x=self.df[date_column],
-                y=rolling_std,
+            fig.add_trace(go.Scattergl(
+                x=x,
+                y=rolling_std.iloc[idx],
                 name='7-point Standard Deviation',
                 line=dict(color='green', dash='dash')
             ))
@@ -190,8 +250,8 @@ class AdvancedAnalytics:
             trend_analysis[col] = {
                 'visualization': fig,
                 'statistics': {
-                    'overall_trend': 'increasing' if self.df[col].corr(pd.Series(range(len(self.df)))) > 0 else 'decreasing',
-                    'volatility': self.df[col].std() / self.df[col].mean() if self.df[col].mean() != 0 else 0
+                    'overall_trend': 'increasing' if trend_cov[i] > 0 else 'decreasing',
+                    'volatility': stds[col] / means[col] if means[col] != 0 else 0
                 }
             }
 
@@ -1,6 +1,9 @@
 import pandas as pd
 import numpy as np
 
+# Leading non-null values checked before parsing a whole column as dates
+DATE_SAMPLE_SIZE = 20
+
 class DataProcessor:
     def __init__(self):
         self.supported_dtypes = ['int64', 'float64', 'object', 'datetime64']
@@ -8,7 +11,13 @@ class DataProcessor:
     def read_data(self, file):
         """Read and perform initial data processing"""
         try:
-            df = pd.read_csv(file)
+            # pyarrow's multithreaded reader, falling back to the default
+            # parser for files it rejects (e.g. ragged rows)
+            try:
+                df = pd.read_csv(file, engine="pyarrow")
+            except Exception:
+                file.seek(0)
+                df = pd.read_csv(file)
             return self.preprocess_data(df)
         except Exception as e:
             raise Exception(f"Error reading file: {str(e)}")
@@ -18,10 +27,12 @@ class DataProcessor:
         # Remove completely empty columns
         df = df.dropna(axis=1, how='all')
         
-        # Convert date columns
+        # Convert date columns; a column is only parsed in full once its
+        # first few values parse, so text columns are rejected cheaply
         for col in df.columns:
             if df[col].dtype == 'object':
                 try:
+                    pd.to_datetime(df[col].dropna().head(DATE_SAMPLE_SIZE))
                     df[col] = pd.to_datetime(df[col])
                 except:
                     pass
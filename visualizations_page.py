@@ -0,0 +1,212 @@
+# visualizations_page.py
+import io
+import pandas as pd
+import streamlit as st
+from utils.data_processor import DataProcessor
+from utils.visualization import VisualizationGenerator
+from utils.advanced_analytics import AdvancedAnalytics
+from utils.deepseek_helper import DeepSeekAnalyzer
+
+
+@st.cache_resource(show_spinner=False)
+def _deepseek_analyzer():
+    """Single DeepSeekAnalyzer shared across reruns and sessions"""
+    return DeepSeekAnalyzer()
+
+@st.cache_resource(show_spinner=False)
+def _data_processor():
+    """DataProcessor is stateless, so one instance serves every upload"""
+    return DataProcessor()
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _read_upload(raw_bytes):
+    """Parse and preprocess an uploaded CSV once per distinct file content"""
+    return _data_processor().read_data(io.BytesIO(raw_bytes))
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_analysis(df):
+    """AI visualization suggestions, computed once per distinct dataset"""
+    return _deepseek_analyzer().analyze_dataset(df)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _build_figure(df, viz_type, columns, title):
+    """Create a suggested chart with the page's common layout, once per dataset and suggestion"""
+    fig = VisualizationGenerator(df).create_visualization(viz_type, list(columns), title)
+    fig.update_layout(
+        autosize=True,
+        height=600,
+        margin=dict(l=50, r=50, t=50, b=50),
+        showlegend=True,
+        template="plotly_white"
+    )
+    return fig
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _suggestion_downloads(df, viz_type, columns, title):
+    """Interactive HTML and CSV for one suggestion, serialised once per dataset.
+
+    Returned as bytes so st.download_button can hand them over without
+    re-encoding the strings on every rerun.
+    """
+    fig = _build_figure(df, viz_type, columns, title)
+    html_bytes = fig.to_html(include_plotlyjs='cdn', full_html=False).encode('utf-8')
+    csv_bytes = df[list(columns)].to_csv(index=False).encode('utf-8')
+    return html_bytes, csv_bytes
+
+def visualizations_page():
+    st.title("📊 AI-Powered Data Visualization Platform")
+    st.write("Upload your dataset and get intelligent visualization suggestions powered by AI!")
+    # File upload
+    uploaded_file = st.file_uploader(
+        "Choose a CSV file",
+        type="csv",
+        help="Upload a CSV file to generate visualizations"
+    )
+
+    if uploaded_file is not None:
+        try:
+            with st.spinner('Processing your data...'):
+                # Read and process data
+                df = _read_upload(uploaded_file.getvalue())
+
+                # Create tabs for different sections
+                main_tabs = st.tabs(["Data Preview", "AI Visualizations", "Advanced Analytics"])
+
+                with main_tabs[0]:
+                    st.subheader("Data Preview")
+                    st.dataframe(df.head(10), use_container_width=True)
+
+                with main_tabs[1]:
+                    # Get data insights using DeepSeek
+                    analysis_results = _cached_analysis(df)
+
+                    st.subheader("AI-Suggested Visualizations")
+                    viz_tabs = st.tabs([f"Visualization {i+1}" for i in range(5)])
+
+                    for i, (tab, suggestion) in enumerate(zip(viz_tabs, analysis_results['suggestions'])):
+                        with tab:
+                            try:
+                                st.markdown(f"### {suggestion['title']}")
+                                viz_col, info_col = st.columns([3, 1])
+
+                                with viz_col:
+                                    fig = _build_figure(
+                                        df,
+                                        suggestion['type'],
+                                        tuple(suggestion['columns']),
+                                        suggestion['title']
+                                    )
+                                    st.plotly_chart(fig, use_container_width=True)
+
+                                with info_col:
+                                    st.markdown("#### Details")
+                                    st.markdown(f"**Type:** {suggestion['type'].capitalize()}")
+                                    st.markdown(f"**Columns used:**")
+                                    for col in suggestion['columns']:
+                                        st.markdown(f"- {col}")
+
+                                    # Download options
+                                    html_bytes, csv_bytes = _suggestion_downloads(
+                                        df,
+                                        suggestion['type'],
+                                        tuple(suggestion['columns']),
+                                        suggestion['title']
+                                    )
+                                    st.download_button(
+                                        label="📥 Download Interactive Plot",
+                                        data=html_bytes,
+                                        file_name=f'visualization_{i+1}.html',
+                                        mime='text/html'
+                                    )
+
+                                    st.download_button(
+                                        label="📥 Download Data (CSV)",
+                                        data=csv_bytes,
+                                        file_name=f'visualization_{i+1}_data.csv',
+                                        mime='text/csv'
+                                    )
+
+                            except Exception as e:
+                                st.error(f"Error creating visualization {i+1}: {str(e)}")
+                                continue
+
+                with main_tabs[2]:
+                    st.subheader("Advanced Data Analysis")
+
+                    # Initialize advanced analytics
+                    advanced_analytics = AdvancedAnalytics(df)
+
+                    # Create subtabs for different analyses
+                    analysis_tabs = st.tabs([
+                        "Statistical Summary",
+                        "Correlation Analysis",
+                        "Outlier Detection",
+                        "Distribution Analysis",
+                        "Trend Analysis"
+                    ])
+
+                    with analysis_tabs[0]:
+                        st.markdown("### Statistical Summary")
+                        stats_summary = advanced_analytics.get_statistical_summary()
+                        if stats_summary:
+                            # One stats x columns frame; each expander shows a slice
+                            all_stats_df = pd.DataFrame(stats_summary)
+                            for col in all_stats_df.columns:
+                                with st.expander(f"Statistics for {col}"):
+                                    st.dataframe(all_stats_df[[col]].set_axis(['Value'], axis=1))
+                        else:
+                            st.info("No numeric columns found for statistical analysis.")
+
+                    with analysis_tabs[1]:
+                        st.markdown("### Correlation Analysis")
+                        corr_fig = advanced_analytics.create_correlation_heatmap()
+                        if corr_fig:
+                            st.plotly_chart(corr_fig, use_container_width=True)
+                        else:
+                            st.info("Insufficient numeric columns for correlation analysis.")
+
+                    with analysis_tabs[2]:
+                        st.markdown("### Outlier Detection")
+                        threshold = st.slider("IQR Threshold", 1.0, 3.0, 1.5, 0.1,
+                                               help="Higher values mean fewer outliers")
+                        outliers = advanced_analytics.detect_outliers(threshold)
+
+                        # One table row per column instead of an expander each
+                        if outliers:
+                            outliers_df = pd.DataFrame({
+                                'Number of outliers': {col: o['count'] for col, o in outliers.items()},
+                                'Percentage of outliers (%)': {col: o['percentage'] for col, o in outliers.items()},
+                                'Lower bound': {col: o['bounds']['lower'] for col, o in outliers.items()},
+                                'Upper bound': {col: o['bounds']['upper'] for col, o in outliers.items()}
+                            }).round(2)
+                            st.dataframe(outliers_df, use_container_width=True)
+
+                    with analysis_tabs[3]:
+                        st.markdown("### Distribution Analysis")
+                        dist_fig = advanced_analytics.create_distribution_plots()
+                        if dist_fig:
+                            st.plotly_chart(dist_fig, use_container_width=True)
+                        else:
+                            st.info("No numeric columns found for distribution analysis.")
+
+                    with analysis_tabs[4]:
+                        st.markdown("### Trend Analysis")
+                        date_cols = df.select_dtypes(include=['datetime64']).columns
+                        if len(date_cols) > 0:
+                            selected_date = st.selectbox("Select Date Column", date_cols)
+                            trends = advanced_analytics.analyze_trends(selected_date)
+                            if trends:
+                                for col, analysis in trends.items():
+                                    with st.expander(f"Trend Analysis for {col}"):
+                                        st.plotly_chart(analysis['visualization'],
+                                                          use_container_width=True)
+                                        st.markdown(f"""
+                                        - Overall trend: {analysis['statistics']['overall_trend']}
+                                        - Volatility: {analysis['statistics']['volatility']:.2f}
+                                        """)
+                        else:
+                            st.info("No datetime columns found for trend analysis.")
+
+        except Exception as e:
+            st.error(f"Error processing file: {str(e)}")
+            st.info("Please make sure your CSV file is properly formatted and try again.")
@@ -0,0 +1,551 @@
+# weather_page.py
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+import folium
+import streamlit as st
+import streamlit.components.v1 as components
+import data_utils as utils
+import weather_api as weather
+import visualization as viz
+import database as db
+import newsletter
+import openai_helper as ai
+
+
+# Current weather metric tiles, laid out two per row like the old st.metric columns
+_METRIC_GRID_CSS = """
+<style>
+.metric-grid {
+    display: grid;
+    grid-template-columns: 1fr 1fr;
+    gap: 1rem;
+}
+.metric-label {
+    font-size: 0.875rem;
+    color: #4b5563;
+}
+.metric-value {
+    font-size: 2.25rem;
+    line-height: 1.3;
+}
+</style>
+"""
+
+def _metric_tile_html(label, value, extra=""):
+    return (
+        f"<div><div class='metric-label'>{label}</div>"
+        f"<div class='metric-value'>{value}</div>{extra}</div>"
+    )
+
+@st.cache_resource(show_spinner=False)
+def _io_pool():
+    """Worker threads for the page's API calls, shared across reruns and sessions"""
+    return ThreadPoolExecutor(max_workers=8)
+
+# Cached lookups - every widget interaction reruns the page, so API results
+# are shared across reruns and sessions. Failed lookups come back as
+# placeholders; those are raised out of the cached function inside _Uncached
+# so st.cache_data never stores them.
+class _Uncached(Exception):
+    def __init__(self, result):
+        super().__init__("result not cached")
+        self.result = result
+
+def _uncached_fallback(cached_fn, *args):
+    """Call cached_fn, returning any result it declined to cache"""
+    try:
+        return cached_fn(*args)
+    except _Uncached as e:
+        return e.result
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def _coords_or_raise(city, state, country):
+    """Geocode a location once per day instead of on every submission"""
+    coordinates = utils.get_coordinates(city, state, country)
+    # get_coordinates also returns None on timeouts and rate limits
+    if coordinates is None:
+        raise _Uncached(None)
+    return coordinates
+
+def _cached_coords(city, state, country):
+    return _uncached_fallback(_coords_or_raise, city, state, country)
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _current_or_raise(lat, lng):
+    """Current weather and AQI, reused for 10 minutes per location"""
+    result = weather.get_current_weather_and_aqi(lat, lng)
+    # Failed calls are filled in with default readings
+    if result.get('error'):
+        raise _Uncached(result)
+    return result
+
+def _cached_current(lat, lng):
+    return _uncached_fallback(_current_or_raise, lat, lng)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _hist_or_raise(lat, lng, start_iso, end_iso):
+    """Last 24 hours data, keyed on an hour-aligned time window"""
+    result = weather.get_historical_data(
+        lat,
+        lng,
+        datetime.fromisoformat(start_iso),
+        datetime.fromisoformat(end_iso)
+    )
+    if isinstance(result, weather.FallbackData):
+        raise _Uncached(result)
+    return result
+
+def _cached_hist(lat, lng, start_iso, end_iso):
+    return _uncached_fallback(_hist_or_raise, lat, lng, start_iso, end_iso)
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _forecast_or_raise(lat, lng):
+    """Daily forecast summary, reused for 10 minutes per location"""
+    result = weather.get_forecast_data(lat, lng)
+    if isinstance(result, weather.FallbackData):
+        raise _Uncached(result)
+    return result
+
+def _cached_forecast(lat, lng):
+    return _uncached_fallback(_forecast_or_raise, lat, lng)
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _last_week_or_raise(lat, lng):
+    """Past week's daily data, reused for 10 minutes per location"""
+    result = weather.get_last_week_data(lat, lng)
+    if isinstance(result, weather.FallbackData):
+        raise _Uncached(result)
+    return result
+
+def _cached_last_week(lat, lng):
+    return _uncached_fallback(_last_week_or_raise, lat, lng)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_ai_advice(location, t_bucket, aqi_bucket):
+    """OpenAI health recommendations for bucketed conditions (2°C / 10 AQI steps)"""
+    # Raises when OpenAI is unavailable, so only real responses are cached
+    return ai.get_ai_recommendations(location, t_bucket, aqi_bucket)
+
+def _cached_advice(location, temperature, aqi):
+    """Health recommendations, falling back to the rule-based advice uncached"""
+    if temperature is None:
+        temperature = 22.0  # Default comfortable temperature
+    if aqi is None:
+        aqi = 50.0  # Default moderate AQI
+
+    if ai.client and ai.OPENAI_API_KEY:
+        try:
+            return _cached_ai_advice(location, round(temperature / 2) * 2, round(aqi / 10) * 10)
+        except Exception as e:
+            print(f"Error with OpenAI API: {str(e)}")
+
+    return ai.generate_rule_based_recommendations(location, temperature, aqi)
+
+@st.cache_data(show_spinner=False)
+def _cached_map_html(lat, lng, label):
+    """Render the location map to a static HTML snapshot once per (lat, lng, label)"""
+    m = folium.Map(location=[lat, lng], zoom_start=10)
+    popup_text = f"""
+    <b>{label}</b><br>
+    Latitude: {lat:.4f}<br>
+    Longitude: {lng:.4f}
+    """
+    folium.Marker(
+        location=[lat, lng],
+        popup=folium.Popup(popup_text, max_width=300),
+        tooltip=label,
+        icon=folium.Icon(color='blue', icon='cloud')
+    ).add_to(m)
+    return m.get_root().render()
+
+@st.cache_resource(show_spinner=False)
+def _newsletter_scheduler():
+    """Start the weekly newsletter job once per process rather than once per session"""
+    try:
+        newsletter.start_scheduler()
+    except Exception as e:
+        print(f"Error starting newsletter scheduler: {str(e)}")
+    return newsletter.scheduler
+
+# Display headers for the daily forecast / last week tables
+_FORECAST_COLUMNS = ['Date', 'Min Temp (°C)', 'Max Temp (°C)', 'Avg Temp (°C)',
+                     'Min AQI', 'Max AQI', 'Avg AQI']
+_LAST_WEEK_COLUMNS = ['Date', 'Min Temp (°C)', 'Max Temp (°C)', 'Avg Temp (°C)',
+                      'Avg Humidity (%)', 'Avg AQI']
+
+def _daily_table(records, columns):
+    """Daily summary records as one display-ready frame: ISO dates, 1 decimal, readable headers"""
+    df = pd.DataFrame.from_records(records)
+    return (
+        df.assign(date=pd.to_datetime(df['date']).dt.strftime('%Y-%m-%d'))
+        .round(1)
+        .set_axis(columns, axis=1)
+    )
+
+# Subscribing only reruns this fragment, not the charts above it
+@st.fragment
+def _newsletter_section(country, state, city):
+    st.markdown("---")
+    st.markdown("## 📫 Subscribe to Weekly Weather Updates")
+    st.markdown("""
+        Get weekly updates delivered to your inbox featuring:
+        - Temperature and AQI trends for your location
+        - Weather highlights from major cities in India
+        - Global weather updates and air quality information
+        - Weekly temperature forecasts and health recommendations
+    """)
+
+    with st.form(key='newsletter_form'):
+        col1, col2 = st.columns(2)
+        with col1:
+            subscriber_name = st.text_input("Your Name")
+        with col2:
+            subscriber_email = st.text_input("Email Address")
+        
+        st.markdown("### Your Location (for personalized updates)")
+        col3, col4, col5 = st.columns(3)
+        with col3:
+            subscriber_country = st.text_input("Country", value=country)
+        with col4:
+            subscriber_state = st.text_input("State/Province", value=state)
+        with col5:
+            subscriber_city = st.text_input("City", value=city)
+        
+        subscribe_button = st.form_submit_button(label='Subscribe to Newsletter')
+        
+        if subscribe_button:
+            if not subscriber_name or not subscriber_email:
+                st.error("Please provide both name and email address.")
+            else:
+                result = db.add_subscriber(
+                    name=subscriber_name,
+                    email=subscriber_email,
+                    city=subscriber_city,
+                    state=subscriber_state,
+                    country=subscriber_country
+                )
+                
+                if result["success"]:
+                    st.success(result["message"])
+                    
+                    with st.spinner("Sending welcome email..."):
+                        try:
+                            email_sent = newsletter.send_welcome_email(result["subscriber"])
+                            if email_sent:
+                                st.success("Welcome email sent to your inbox!")
+                            else:
+                                st.warning("Welcome email could not be sent. You'll still receive the weekly newsletter.")
+                        except Exception as e:
+                            st.warning(f"Welcome email could not be sent: {str(e)}. You'll still receive the weekly newsletter.")
+                    
+                    st.markdown("""
+                        #### 🎉 Welcome to IcoHealth Weather Newsletter!
+                        
+                        You'll receive your first newsletter this Sunday at 8 AM. Each newsletter includes:
+                        - Personalized weather forecast for your location
+                        - Temperature and AQI trends across India
+                        - Global weather highlights
+                        - Health recommendations based on weather conditions
+                        
+                        You can unsubscribe at any time using the link in the newsletter.
+                    """)
+                else:
+                    st.error(result["message"])
+
+def weather_page():
+    # Session state initialization
+    for key, default in (
+        ('location_submitted', False),
+        ('current_data', None),
+        ('historical_data', None),
+        ('health_advice', None),
+        ('error', None),
+        ('coordinates', None),
+        ('location_info', {"city": "", "state": "", "country": ""}),
+        ('last_coords', None),
+        ('forecast_view', None),
+        ('last_week_view', None),
+    ):
+        st.session_state.setdefault(key, default)
+
+    st.markdown(_METRIC_GRID_CSS, unsafe_allow_html=True)
+    st.title("🌤️Weather & Health Advisor")
+    st.markdown("""
+        Get real-time weather, air quality data, and personalized health recommendations based on your location.
+        Enter your location details below to begin.
+    """)
+
+    # Location input form
+    with st.form(key='location_form'):
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            country = st.text_input("Country")
+        with col2:
+            state = st.text_input("State/Province")
+        with col3:
+            city = st.text_input("City")
+        
+        submit_button = st.form_submit_button(label='Get Weather Data')
+        
+        if submit_button:
+            city, state, country = city.strip(), state.strip(), country.strip()
+
+        # Don't spend a geocoding call on a submit that can only fail
+        if submit_button and not (city and state and country):
+            st.session_state.error = "Please fill in country, state, and city."
+            st.session_state.location_submitted = False
+        elif submit_button:
+            try:
+                st.session_state.error = None
+                with st.spinner("Fetching data..."):
+                    # Get coordinates from location; lower-cased so "Paris"
+                    # and "paris " share one cached lookup
+                    coordinates = _cached_coords(city.lower(), state.lower(), country.lower())
+                    
+                    if not coordinates:
+                        st.session_state.error = "Unable to find coordinates for the specified location. Please check the spelling and try again."
+                        st.session_state.location_submitted = False
+                    else:
+                        # Round to ~100 m so nearby lookups share cache entries
+                        lat = round(coordinates['lat'], 3)
+                        lng = round(coordinates['lng'], 3)
+
+                        # Get last 24 hours data only
+                        end_date = datetime.now().replace(minute=0, second=0, microsecond=0)
+                        start_date = end_date - timedelta(days=1)  # 24 hours
+
+                        # The historical fetch is independent of the current
+                        # weather -> AI advice chain, so run them side by side
+                        pool = _io_pool()
+                        hist_future = pool.submit(
+                            _cached_hist,
+                            lat,
+                            lng,
+                            start_date.isoformat(),
+                            end_date.isoformat()
+                        )
+                        current_future = pool.submit(_cached_current, lat, lng)
+
+                        # Get current weather and AQI data
+                        current_data = current_future.result()
+
+                        # Get health recommendations based on temperature and AQI,
+                        # bucketed so nearly identical conditions share one AI call
+                        advice_future = pool.submit(
+                            _cached_advice,
+                            f"{city}, {state}, {country}",
+                            current_data.get('temperature'),
+                            current_data.get('aqi')
+                        )
+
+                        historical_data = hist_future.result()
+                        health_advice = advice_future.result()
+
+                        # Update session state
+                        st.session_state.current_data = current_data
+                        st.session_state.historical_data = historical_data
+                        st.session_state.health_advice = health_advice
+                        st.session_state.coordinates = coordinates
+                        st.session_state.location_info = {"city": city, "state": state, "country": country}
+                        st.session_state.location_submitted = True
+                        # A fresh submit always rebuilds the forecast/last week views
+                        st.session_state.last_coords = None
+                        
+            except Exception as e:
+                st.session_state.error = f"An error occurred: {str(e)}"
+                st.session_state.location_submitted = False
+
+    # Display error message if any
+    if st.session_state.error:
+        st.error(st.session_state.error)
+
+    # Display results if location submitted
+    if st.session_state.location_submitted and st.session_state.current_data:
+        # Create two columns for map and weather data side by side
+        map_col, weather_col = st.columns(2)
+        
+        # Column 1: Map display. The map HTML renders in the background while
+        # the weather panel is filled in, then lands in its placeholder.
+        with map_col:
+            st.markdown("## Location Map")
+            map_placeholder = st.empty()
+
+        map_future = None
+        if st.session_state.coordinates:
+            location_info = st.session_state.location_info
+            location_name = f"{location_info['city']}, {location_info['state']}, {location_info['country']}"
+            map_future = _io_pool().submit(
+                _cached_map_html,
+                st.session_state.coordinates['lat'],
+                st.session_state.coordinates['lng'],
+                location_name
+            )
+
+        # Column 2: Current Weather and AQI Data
+        with weather_col:
+            st.markdown("## Current Weather and AQI Data")
+            
+            current_data = st.session_state.current_data
+
+            feels_like = current_data.get('temperature_apparent', 'N/A')
+            if feels_like != 'N/A':
+                feels_like = f"{feels_like:.1f}°C"
+
+            humidity = current_data.get('humidity', 'N/A')
+            if humidity != 'N/A':
+                humidity = f"{humidity:.1f}%"
+
+            cloud_cover = current_data.get('cloud_cover', 'N/A')
+            if cloud_cover != 'N/A':
+                cloud_cover = f"{cloud_cover:.0f}%"
+
+            aqi = current_data['aqi']
+            aqi_color = utils.get_aqi_color(aqi)
+            aqi_label = utils.get_aqi_label(aqi)
+
+            wind_speed = current_data.get('wind_speed', 'N/A')
+            if wind_speed != 'N/A':
+                wind_speed = f"{wind_speed:.1f} m/s"
+
+            pressure = current_data.get('pressure', 'N/A')
+            if pressure != 'N/A':
+                pressure = f"{pressure:.1f} hPa"
+
+            visibility = current_data.get('visibility', 'N/A')
+            if visibility != 'N/A':
+                visibility = f"{visibility:.1f} km"
+
+            # Render every tile in a single markdown call rather than one
+            # st.metric component per value
+            tiles = [
+                _metric_tile_html(
+                    "Temperature",
+                    f"{current_data['temperature']:.1f}°C",
+                    f"<div style='color:#09ab3b;'>{utils.celsius_to_fahrenheit(current_data['temperature']):.1f}°F</div>"
+                ),
+                _metric_tile_html(
+                    f"Air Quality Index ({aqi_label})",
+                    f"{aqi:.1f}",
+                    f"<div style='width:100%;height:20px;background-color:{aqi_color}'></div>"
+                ),
+                _metric_tile_html("Feels Like", feels_like),
+                _metric_tile_html("Wind Speed", wind_speed),
+                _metric_tile_html("Humidity", humidity),
+                _metric_tile_html("Pressure", pressure),
+                _metric_tile_html("Cloud Coverage", cloud_cover),
+                _metric_tile_html("Visibility", visibility),
+            ]
+            st.markdown(
+                f"<div class='metric-grid'>{''.join(tiles)}</div>",
+                unsafe_allow_html=True
+            )
+
+
+        with map_placeholder.container():
+            try:
+                if map_future is not None:
+                    components.html(map_future.result(), height=500)
+                else:
+                    st.warning("Location coordinates not available.")
+            except Exception as e:
+                st.error(f"Error displaying location map: {str(e)}")
+
+        # Get and display forecast data. The figures and tables are kept in
+        # session state and only rebuilt when the location changes.
+        if st.session_state.location_submitted and not st.session_state.error:
+            if st.session_state.coordinates:
+                coords_key = (st.session_state.coordinates['lat'], st.session_state.coordinates['lng'])
+                if st.session_state.last_coords != coords_key:
+                    st.session_state.forecast_view = None
+                    st.session_state.last_week_view = None
+                    st.session_state.last_coords = coords_key
+
+            try:
+                if st.session_state.coordinates:
+                    if st.session_state.forecast_view is None:
+                        forecast_data = _cached_forecast(*coords_key)
+                        st.session_state.forecast_view = (
+                            viz.plot_forecast(forecast_data),
+                            _daily_table(forecast_data, _FORECAST_COLUMNS)
+                        )
+                    forecast_fig, forecast_df = st.session_state.forecast_view
+
+                    st.markdown("## Weather & AQI Forecast (Next Few Days)")
+                    st.plotly_chart(forecast_fig, use_container_width=True)
+                    st.dataframe(forecast_df, use_container_width=True, hide_index=True)
+                else:
+                    st.warning("Location coordinates not available for forecast data.")
+            except Exception as e:
+                st.error(f"Error getting forecast data: {str(e)}")
+                
+            # Last week data
+            try:
+                if st.session_state.coordinates:
+                    if st.session_state.last_week_view is None:
+                        last_week_data = _cached_last_week(*coords_key)
+                        if last_week_data:
+                            # Both week charts come from one call
+                            temp_fig, aqi_humidity_fig = viz.plot_last_week_data(last_week_data)
+                            last_week_df = _daily_table(last_week_data, _LAST_WEEK_COLUMNS)
+                        else:
+                            temp_fig = aqi_humidity_fig = last_week_df = None
+                        st.session_state.last_week_view = (temp_fig, aqi_humidity_fig, last_week_df)
+                    temp_fig, aqi_humidity_fig, last_week_df = st.session_state.last_week_view
+                
+                    st.markdown("## Last Week's Historical Weather Data")
+                    st.markdown("*Temperature, humidity, and air quality data for the past 7 days*")
+                    
+                    week_tabs = st.tabs(["Temperature", "Air Quality & Humidity", "Data Table"])
+                    
+                    with week_tabs[0]:
+                        if temp_fig is not None:
+                            st.plotly_chart(temp_fig, use_container_width=True)
+                        else:
+                            st.warning("No temperature data available for the past week")
+                    
+                    with week_tabs[1]:
+                        if aqi_humidity_fig is not None:
+                            st.plotly_chart(aqi_humidity_fig, use_container_width=True)
+                        else:
+                            st.warning("No AQI and humidity data available for the past week")
+                    
+                    with week_tabs[2]:
+                        if last_week_df is not None:
+                            st.markdown("### Weather Data Table (Last 7 Days)")
+                            st.dataframe(last_week_df, use_container_width=True, hide_index=True)
+                        else:
+                            st.warning("No historical data available for the past week")
+                else:
+                    st.warning("Location coordinates not available for historical data.")
+                
+            except Exception as e:
+                st.error(f"Error getting last week data: {str(e)}")
+
+
+        # Health recommendations
+        st.markdown("## Health Recommendations")
+        st.markdown(st.session_state.health_advice)
+        
+        # Last 24 Hours Data visualizations
+        if st.session_state.historical_data and len(st.session_state.historical_data) > 0:
+            st.markdown("## Last 24 Hours Data")
+            
+            last24h_tab1, last24h_tab2 = st.tabs(["Temperature", "Air Quality"])
+            
+            with last24h_tab1:
+                temp_24h_fig = viz.plot_temperature_last_24h(st.session_state.historical_data)
+                st.plotly_chart(temp_24h_fig, use_container_width=True)
+                
+            with last24h_tab2:
+                aqi_24h_fig = viz.plot_aqi_last_24h(st.session_state.historical_data)
+                st.plotly_chart(aqi_24h_fig, use_container_width=True)
+        else:
+            st.info("Last 24 hours data is not available for this location.")
+
+    # Newsletter subscription section
+    _newsletter_section(country, state, city)
+
+    # Start the newsletter scheduler (once per process, after the page has rendered)
+    _newsletter_scheduler()